@@ -1,5 +1,13 @@
+import re
+from functools import lru_cache
+from typing import Any, Final, Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from pydantic import Field, field_validator, model_validator
+
+_UUID_RE: Final[re.Pattern[str]] = re.compile(
+    r"^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$"
+)
 
 
 class Settings(BaseSettings):
@@ -25,23 +33,108 @@ class Settings(BaseSettings):
         ...,
         description="Email address for sending email",
     )
-    GMAIL_PASSWORD: str = Field(
-        ...,
-        description="Email password for sending email",
+    GMAIL_PASSWORD: Optional[str] = Field(
+        default=None,
+        description="Email (app) password; not needed when Gmail OAuth is configured",
+    )
+    GMAIL_OAUTH_CLIENT_ID: Optional[str] = Field(
+        default=None,
+        description="OAuth client id for XOAUTH2 login to Gmail SMTP",
+    )
+    GMAIL_OAUTH_CLIENT_SECRET: Optional[str] = Field(
+        default=None,
+        description="OAuth client secret for XOAUTH2 login to Gmail SMTP",
+    )
+    GMAIL_OAUTH_REFRESH_TOKEN: Optional[str] = Field(
+        default=None,
+        description="OAuth refresh token (https://mail.google.com/ scope) for XOAUTH2 login",
+    )
+    SMTP_POOL_SIZE: int = Field(
+        default=2,
+        ge=1,
+        description="Number of SMTP sessions kept open for notifications",
+    )
+    AZURE_HTTP_POOL_SIZE: int = Field(
+        default=100,
+        ge=1,
+        description="Keep-alive connections pooled for Azure management (ARM) calls",
+    )
+    AZURE_POLL_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent ARM status polls for running operations",
+    )
+    STATUS_CACHE_MAX: int = Field(
+        default=10_000,
+        ge=1,
+        description="Approximate maximum number of provisioning statuses kept in memory",
+    )
+    STATUS_CACHE_TTL: int = Field(
+        default=86400,
+        ge=1,
+        description="Seconds a provisioning status is kept after its last update",
+    )
+    STATUS_BACKEND: Literal["memory", "redis"] = Field(
+        default="memory",
+        description=(
+            "Where provisioning statuses are kept: per-process memory or Redis; "
+            "defaults to redis when REDIS_URL is set"
+        ),
+    )
+    REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis URL for sharing provisioning status across workers",
     )
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
     )
+
+    @field_validator("AZURE_SUBSCRIPTION_ID")
+    @classmethod
+    def validate_subscription_id(cls, value: str) -> str:
+        if not _UUID_RE.fullmatch(value):
+            raise ValueError("AZURE_SUBSCRIPTION_ID must be a UUID")
+        return value
+
+    @model_validator(mode="before")
+    @classmethod
+    def default_status_backend(cls, data: Any) -> Any:
+        # REDIS_URL alone has always meant "share statuses through Redis"
+        if isinstance(data, dict) and data.get("REDIS_URL") and not data.get("STATUS_BACKEND"):
+            data = {**data, "STATUS_BACKEND": "redis"}
+        return data
+
+    @model_validator(mode="after")
+    def validate_gmail_auth(self) -> "Settings":
+        oauth = (
+            self.GMAIL_OAUTH_CLIENT_ID,
+            self.GMAIL_OAUTH_CLIENT_SECRET,
+            self.GMAIL_OAUTH_REFRESH_TOKEN,
+        )
+        if any(oauth) and not all(oauth):
+            raise ValueError(
+                "GMAIL_OAUTH_CLIENT_ID, GMAIL_OAUTH_CLIENT_SECRET and "
+                "GMAIL_OAUTH_REFRESH_TOKEN must be set together"
+            )
+        if not self.GMAIL_PASSWORD and not all(oauth):
+            raise ValueError("Set GMAIL_PASSWORD or the GMAIL_OAUTH_* settings")
+        if self.STATUS_BACKEND == "redis" and not self.REDIS_URL:
+            raise ValueError("STATUS_BACKEND=redis requires REDIS_URL")
+        return self
     # class Config:
     #     env_file = ".env"
     #     env_file_encoding = "utf-8"
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Dependency function to retrieve
     configuration settings.
+    The instance is built once per process and reused,
+    so the .env file is only read and validated once.
     Returns:
         Settings: configuration settings instance.
     """
@@ -1,8 +1,58 @@
-from fastapi import FastAPI
-from app.routers.cosmos_router import router as cosmos_router
-from app.services.logging_service import logger
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import AsyncIterator
+from azure.core.exceptions import AzureError
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from app.core.config.settings import get_settings
+from app.routers.cosmos_router import make_cosmos_manager, router as cosmos_router
+from app.services.azure_cosmos_manager import close_shared_clients, configure_lro_polling
+from app.services.email_service import (
+    close_gmail_sender,
+    start_mail_worker,
+    stop_mail_worker,
+)
+from app.services.logging_service import configure_logging, logger, stop_logging
+from app.services.status_tracker import StatusTracker
 
-logger.info("Starting the application")
-app = FastAPI()
+_AZURE_DETAIL_BASE = MappingProxyType({"error_code": "AZURE_ERROR"})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application startup/shutdown hook: logging, Azure clients, email queue and SMTP session."""
+    configure_logging()
+    logger.info("Starting the application")
+    settings = get_settings()
+    StatusTracker.configure(
+        settings.STATUS_BACKEND,
+        settings.REDIS_URL,
+        max_entries=settings.STATUS_CACHE_MAX,
+        ttl=settings.STATUS_CACHE_TTL,
+    )
+    configure_lro_polling(settings.AZURE_POLL_CONCURRENCY)
+    # build the shared Azure client once, before the first request
+    manager = make_cosmos_manager(settings)
+    await start_mail_worker()
+    yield
+    await stop_mail_worker()
+    close_gmail_sender()
+    await manager.close()
+    make_cosmos_manager.cache_clear()
+    await close_shared_clients()
+    logger.info("Stopping the application")
+    stop_logging()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(cosmos_router)
 
+
+@app.exception_handler(AzureError)
+async def azure_error_handler(request: Request, exc: AzureError) -> JSONResponse:
+    """Maps Azure SDK errors raised by any endpoint to a 500 response."""
+    logger.error("%s", exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": _AZURE_DETAIL_BASE | {"message": str(exc)}},
+    )
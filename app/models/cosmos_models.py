@@ -1,17 +1,25 @@
-#import re
+import re
 from datetime import datetime
-from pydantic import BaseModel, Field
-#from pydantic import field_validator
+from typing import Final
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic import field_validator
 from app.models.custom_types import CosmosAPIType, CosmosAccountStatus
 
+# compiled once at import instead of per schema build
+_ACCOUNT_NAME_RE: Final[re.Pattern[str]] = re.compile(
+    r"^[a-z]+[a-z0-9-]{1,42}[a-z0-9]$"
+)
+
 
 # noinspection SpellCheckingInspection
 class CreateCosmosAccountRequest(BaseModel):
+    # immutable once validated; validate_assignment stays off
+    model_config = ConfigDict(frozen=True)
+
     account_name: str = Field(
         ...,
         min_length=3,
         max_length=44,
-        pattern=r"^[a-z]+[a-z0-9-]{1,42}[a-z0-9]$",
         examples=["my-cosmos-account"],
     )
     location: str=Field(
@@ -23,22 +31,22 @@ class CreateCosmosAccountRequest(BaseModel):
         default=CosmosAPIType.SQL,
         examples=["sql"]
     )
-    # @field_validator("account_name")
-    # def validate_account_name(cls, value: str)->str:
-    #     if not re.fullmatch(
-    #         r"^[a-z]+[a-z0-9-]{1,42}[a-z0-9]$",
-    #         value
-    #     ):
-    #         raise ValueError("""
-    #         Invalid Account name. Must be:\n
-    #         - between 3 and 44 characters\n
-    #         - lowercase letters, numbers, and hyphens only\n
-    #         - cannot start or end with a hyphen\n
-    #         - cannot have consecutive hyphens.
-    #         """)
-    #     return value
+    @field_validator("account_name")
+    @classmethod
+    def validate_account_name(cls, value: str)->str:
+        if not _ACCOUNT_NAME_RE.fullmatch(value):
+            raise ValueError("""
+            Invalid Account name. Must be:\n
+            - between 3 and 44 characters\n
+            - lowercase letters, numbers, and hyphens only\n
+            - cannot start or end with a hyphen\n
+            """)
+        return value
 
 class CosmosAccountStatusResponse(BaseModel):
+    # built from trusted internal state via model_construct()
+    model_config = ConfigDict(frozen=True)
+
     account_name: str
     status: CosmosAccountStatus
     created_at: datetime
@@ -51,3 +59,8 @@ class ErrorResponse(BaseModel):
     error_code: str
     timestamp: datetime
 
+
+
+# build validators/serializers at import rather than on first request
+CreateCosmosAccountRequest.model_rebuild(force=True)
+CosmosAccountStatusResponse.model_rebuild(force=True)
@@ -1,10 +1,12 @@
-from enum import Enum
+from enum import Enum, unique
 from typing import TypedDict
 
+@unique
 class CosmosAPIType(str, Enum):
     SQL = "sql"
     MONGO = "mongo"
 
+@unique
 class CosmosAccountStatus(str, Enum):
     QUEUED = "queued"
     IN_PROGRESS = "in_progress"
@@ -1,7 +1,18 @@
-from typing import Annotated
-from app.services.email_templates import  send_failure_notification, send_deletion_failure_email
+import asyncio
+import hashlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Optional
+from weakref import WeakValueDictionary
+from app.services.email_templates import (
+    send_failure_notification,
+    send_deletion_failure_email,
+    send_success_notification,
+)
+from app.services.email_service import run_notification
+from azure.core.polling import AsyncLROPoller
 from azure.core.exceptions import AzureError
-from fastapi import APIRouter, BackgroundTasks, status, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, status, HTTPException, Depends, Header, Response
 from app.services.logging_service import logger
 
 from app.models.cosmos_models import (
@@ -9,7 +20,7 @@ from app.models.cosmos_models import (
     CosmosAccountStatusResponse,
     ErrorResponse
 )
-from app.services.azure_cosmos_manager import AzureCosmosManager
+from app.services.azure_cosmos_manager import AccountNotFound, AzureCosmosManager, watch_lro
 from app.services.status_tracker import StatusTracker
 from app.models.custom_types import CosmosAPIType, CosmosAccountStatus
 from app.core.config.settings import get_settings, Settings
@@ -21,16 +32,64 @@ router = APIRouter(
     }
 )
 
+# seconds between provisioning status refreshes while an LRO is running
+_POLL_STATUS_INTERVAL = 5
+
+_NOT_FOUND_DETAIL_BASE = MappingProxyType({"error_code": "ACCOUNT_NOT_FOUND"})
+_CONFLICT_DETAIL_BASE = MappingProxyType({"error_code": "PROVISIONING_IN_PROGRESS"})
+_DELETION_CONFLICT_DETAIL_BASE = MappingProxyType({"error_code": "DELETION_IN_PROGRESS"})
+
+# statuses for which another create request is still being handled
+_ACTIVE_STATUSES = frozenset({CosmosAccountStatus.QUEUED, CosmosAccountStatus.IN_PROGRESS})
+
+# messages the delete endpoint records while a deletion is still running
+_DELETION_QUEUED_MESSAGE = "Deletion Initiated"
+_DELETION_SENT_MESSAGE = "Deletion request sent to Azure"
+_DELETION_MESSAGES = frozenset({_DELETION_QUEUED_MESSAGE, _DELETION_SENT_MESSAGE})
+
+# one lock per account being provisioned; entries vanish once unused
+_provisioning_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+
+
+def _status_response(
+        record: CosmosAccountStatusResponse,
+        status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Serializes a status record straight to JSON bytes with pydantic-core,
+    skipping FastAPI's response_model re-validation and json.dumps pass.
+    """
+    return Response(
+        content=record.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
-async def get_cosmos_manager(settings: Annotated[Settings, Depends(get_settings)]) -> AzureCosmosManager:
-    """Dependency that provides a configured AzureCosmosManager instance"""
+@lru_cache(maxsize=4)
+def make_cosmos_manager(settings: Settings) -> AzureCosmosManager:
+    """
+    Builds one AzureCosmosManager per distinct configuration
+    (subscription id, resource group, ...) so the SDK client,
+    credential and connection pool are reused across requests.
+    The application lifespan calls this at startup to warm the cache.
+    """
     return AzureCosmosManager(
         subscription_id=settings.AZURE_SUBSCRIPTION_ID,
-        resource_group=settings.AZURE_RESOURCE_GROUP
+        resource_group=settings.AZURE_RESOURCE_GROUP,
+        settings=settings,
     )
 
 
+async def get_cosmos_manager() -> AzureCosmosManager:
+    """
+    Dependency that provides the shared AzureCosmosManager instance.
+    Takes no sub-dependencies so FastAPI does not walk a settings
+    node per request; both lookups below are cache hits.
+    """
+    return make_cosmos_manager(get_settings())
+
+
 @router.post(
     "/accounts",
     status_code=status.HTTP_202_ACCEPTED,
@@ -43,108 +102,113 @@ async def get_cosmos_manager(settings: Annotated[Settings, Depends(get_settings)
         status.HTTP_400_BAD_REQUEST: {
             "descriptions": "Invalid Account name",
             "content": {"application/json": {"example": {"detail":"Invalid account name. Must be: ..."}}}
-        }
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorResponse,
+            "description": "Provisioning or deletion already queued or in progress",
+        },
     }
 )
 async def create_cosmos_account(
         request: CreateCosmosAccountRequest,
         background_tasks: BackgroundTasks,
         manager: Annotated[AzureCosmosManager, Depends(get_cosmos_manager)],
-        settings: Annotated[Settings, Depends(get_settings)]
-) -> CosmosAccountStatusResponse:
+) -> Response:
     """EndPoint to initiate CosmosDB account provisioning"""
-    try:
-        # set Initial status
-        StatusTracker.update_status(
-            account_name=request.account_name,
-            status=CosmosAccountStatus.QUEUED,
+    # errors propagate to the exception handlers registered in app.main
+    current = await StatusTracker.get_status_async(request.account_name)
+    if current is not None and current.status in _ACTIVE_STATUSES:
+        if current.message in _DELETION_MESSAGES:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=_DELETION_CONFLICT_DETAIL_BASE | {
+                    "message": f"CosmosDB account {request.account_name} is being deleted",
+                },
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_CONFLICT_DETAIL_BASE | {
+                "message": f"CosmosDB account {request.account_name} is already {current.status.value}",
+            },
         )
+    queued_status = await StatusTracker.update_status_async(
+        account_name=request.account_name,
+        status=CosmosAccountStatus.QUEUED,
+    )
 
-        # Start async provisioning
-        background_tasks.add_task(
-            execute_provisioning,
-            manager,
-            request.account_name,
-            request.location,
-            request.api_type,
-            settings
-        )
+    # Start async provisioning
+    background_tasks.add_task(
+        execute_provisioning,
+        manager,
+        request.account_name,
+        request.location,
+        request.api_type,
+        manager.settings
+    )
 
-        return StatusTracker.get_status(request.account_name)
-    except ValueError as e:
-        logger.error(str(e))
-        StatusTracker.update_status(
-            account_name=request.account_name,
-            status=CosmosAccountStatus.ERROR,
-            message=str(e),
-        )
-        # handle validation errors
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
-            "error_code": "VALIDATION_ERROR",
-            "message": str(e),
-        }, )
-
-    except AzureError as e:
-        background_tasks.add_task(
-            send_failure_notification,
-            request.account_name,
-            str(e),
-            settings
-        )
-        logger.error(str(e))
-        StatusTracker.update_status(
-            account_name=request.account_name,
-            status=CosmosAccountStatus.ERROR,
-            message=str(e),
-        )
-        # handle azure specific errors
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={
-            "error_code": "AZURE_ERROR",
-            "message": str(e),
-        })
-    except Exception as e:
-        background_tasks.add_task(
-            send_failure_notification,
-            request.account_name,
-            str(e),
-            settings
-        )
-        logger.error(str(e))
-        StatusTracker.update_status(
-            account_name=request.account_name,
-            status=CosmosAccountStatus.ERROR,
-            message=str(e),
-        )
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={
-            "error_code": "INTERNAL_ERROR"+" "+str(e),
-        })
+    return _status_response(queued_status, status.HTTP_202_ACCEPTED)
 
 
 @router.get(
     "/accounts/{account_name}",
     response_model=CosmosAccountStatusResponse,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "Status unchanged since the given ETag"},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Not found"},
     }
 )
 async def get_provisioning_status(
         account_name: str,
-) -> CosmosAccountStatusResponse:
+        if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Get current provisioning status of CosmosDB account
     Args:
         account_name: CosmosDB account name
+        if_none_match: ETag from a previous poll; 304 if still current
 
     Returns:
         Current provisioning status and details
     """
-    account_status = StatusTracker.get_status(account_name)
-    if account_status is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
-            "error_code": "ACCOUNT_NOT_FOUND",
-            "message": f"Provisioning for CosmosDB account {account_name} not found",
-        })
-    return account_status
+    payload = await StatusTracker.get_status_json_async(account_name)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_NOT_FOUND_DETAIL_BASE | {
+                "message": f"Provisioning for CosmosDB account {account_name} not found",
+            },
+        )
+    # the cached JSON changes exactly when the status record does
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+async def _wait_for_poller(poller: AsyncLROPoller[Any], account_name: str) -> None:
+    """
+    Waits for an Azure LRO (polled by the shared LroMux) while
+    periodically recording its status as IN_PROGRESS.
+    Raises:
+        Exception: whatever the long-running operation failed with
+    """
+    result = watch_lro(poller)
+    last_status: Optional[str] = None
+    while True:
+        done, _ = await asyncio.wait({result}, timeout=_POLL_STATUS_INTERVAL)
+        if done:
+            result.result()
+            return
+        # rewrite only on change, so updated_at and the ETag stay stable
+        current = poller.status()
+        if current == last_status:
+            continue
+        last_status = current
+        await StatusTracker.update_status_async(
+            account_name=account_name,
+            status=CosmosAccountStatus.IN_PROGRESS,
+            message=f"Provisioning status: {current}"
+        )
 
 
 async def execute_provisioning(
@@ -155,92 +219,127 @@ async def execute_provisioning(
         settings: Settings,
 ) -> None:
     """Background task for actual provisioning"""
+    lock = _provisioning_locks.setdefault(account_name, asyncio.Lock())
+    async with lock:
+        await _provision(manager, account_name, location, api_type, settings)
+
+
+async def _provision(
+        manager: AzureCosmosManager,
+        account_name: str,
+        location: str,
+        api_type: CosmosAPIType,
+        settings: Settings,
+) -> None:
+    """Provisions one account; called with the account's lock held."""
     try:
         # Update status to in-progress
-        StatusTracker.update_status(
+        await StatusTracker.update_status_async(
             account_name=account_name,
             status=CosmosAccountStatus.IN_PROGRESS,
             message="Resource provisioning started"
         )
         # perform actual provisioning
-        await manager.create_account_async(
+        poller = await manager.create_account_async(
             account_name=account_name,
             location=location,
             api_type=api_type,
         )
+        await _wait_for_poller(poller, account_name)
     except Exception as e:
-        logger.error(str(e))
+        logger.error("%s", e)
         # update status on error
-        StatusTracker.update_status(
+        await StatusTracker.update_status_async(
             account_name=account_name,
             status=CosmosAccountStatus.ERROR,
             message=str(e),
         )
-        send_failure_notification(
+        # send on the SMTP executor so it does not block the event loop
+        await run_notification(
+            send_failure_notification,
             account_name,
             str(e),
             settings
         )
+    else:
+        completed = await StatusTracker.update_status_async(
+            account_name=account_name,
+            status=CosmosAccountStatus.COMPLETED,
+            message="Provisioning completed successfully"
+        )
+        # the email reports the same completion time as the status record
+        await run_notification(
+            send_success_notification,
+            account_name,
+            api_type,
+            location,
+            settings,
+            completed.updated_at
+        )
 @router.delete(
     "/accounts/{account_name}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_cosmos_account(
         account_name: str,
-        manager: Annotated[AzureCosmosManager, Depends(get_cosmos_manager)],
-        settings: Annotated[Settings, Depends(get_settings)]) -> None:
+        manager: Annotated[AzureCosmosManager, Depends(get_cosmos_manager)]) -> None:
    """
    Deletes a Cosmos DB account and sends appropriate notifications
 
    Args:
         account_name: Name of the account to delete
         manager: Injected AzureCosmosManager dependency
-        settings: Injected Settings dependency
     Raises:
         HTTPException: If account does not exist or errors
    """
+   settings = manager.settings
    try:
-        StatusTracker.update_status(
+        await StatusTracker.update_status_async(
           account_name=account_name,
           status=CosmosAccountStatus.QUEUED,
-            message="Deletion Initiated"
+            message=_DELETION_QUEUED_MESSAGE
         )
         await manager.delete_account_async(account_name)
-        StatusTracker.update_status(
+        await StatusTracker.update_status_async(
             account_name,
             CosmosAccountStatus.IN_PROGRESS,
-            message="Deletion request sent to Azure"
+            message=_DELETION_SENT_MESSAGE
         )
-   except ValueError as e:
-       #account does not exist
-        StatusTracker.update_status(
+   except AccountNotFound as e:
+        await StatusTracker.update_status_async(
             account_name=account_name,
             status=CosmosAccountStatus.ERROR,
             message="Account not found"
         )
-        send_deletion_failure_email(
-                account_name,
-                str(e),
-           settings
+        await run_notification(
+            send_deletion_failure_email,
+            account_name,
+            str(e),
+            settings
         )
         raise HTTPException(
               status_code=status.HTTP_404_NOT_FOUND,
-              detail={
-                "error_code": "ACCOUNT_NOT_FOUND",
-                "message": str(e),
-              }
+              detail=_NOT_FOUND_DETAIL_BASE | {"message": str(e)}
         )
    except AzureError as e:
-         #Azure error
-         send_deletion_failure_email(
+         #Azure error, formatted by the AzureError handler in app.main
+         await StatusTracker.update_status_async(
+             account_name=account_name,
+             status=CosmosAccountStatus.ERROR,
+             message=str(e)
+         )
+         await run_notification(
+             send_deletion_failure_email,
              account_name,
              str(e),
              settings
          )
-         raise HTTPException(
-              status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-              detail={
-                "error_code": "AZURE_ERROR",
-                "message": str(e),
-              }
-         )
\ No newline at end of file
+         raise
+   except Exception as e:
+         # unexpected failure: don't leave the account looking mid-deletion
+         await StatusTracker.update_status_async(
+             account_name=account_name,
+             status=CosmosAccountStatus.ERROR,
+             message=str(e)
+         )
+         raise
@@ -1,233 +1,568 @@
+from __future__ import annotations
+
 import asyncio
-from typing import Optional
-from datetime import datetime
+import functools
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar, cast
 
 import app.services.email_templates
-from app.core.config.settings import get_settings
+from app.services.email_service import run_notification
+from app.core.config.settings import get_settings, Settings
 from app.services.logging_service import logger
 
-from azure.identity import AzureCliCredential
-from azure.core.credentials import TokenCredential
-from azure.mgmt.cosmosdb import CosmosDBManagementClient
-from azure.mgmt.cosmosdb.models import (
-    DatabaseAccountCreateUpdateParameters,
-Location,
-DatabaseAccountKind,
-DatabaseAccountGetResults,
-ApiProperties
-)
+from azure.core.credentials import AccessToken
+from azure.core.credentials_async import AsyncTokenCredential
+from azure.core.exceptions import AzureError, ResourceNotFoundError
+from azure.core.polling.async_base_polling import AsyncLROBasePolling
 
-from azure.core.exceptions import AzureError
+# azure.identity, aiohttp and the generated azure.mgmt.cosmosdb client and
+# models are imported where first used, so importing the app (tests,
+# tooling, a preloading master process) does not pay for them
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.core.polling import AsyncLROPoller
+    from azure.mgmt.cosmosdb.aio import CosmosDBManagementClient
+    from azure.mgmt.cosmosdb.models import (
+        ApiProperties,
+        DatabaseAccountCreateUpdateParameters,
+        DatabaseAccountGetResults,
+        DatabaseAccountKind,
+    )
 
 from app.models.custom_types import CosmosAPIType, CosmosAccountStatus
-from app.models.cosmos_models import CosmosAccountStatusResponse
 from app.services.status_tracker import StatusTracker
 
 
+class AccountNotFound(Exception):
+    """Raised when ARM reports that a Cosmos DB account does not exist."""
+
+@functools.lru_cache(maxsize=None)
+def _kind_map() -> Dict[CosmosAPIType, DatabaseAccountKind]:
+    """API type -> Azure account kind, built on first use."""
+    from azure.mgmt.cosmosdb.models import DatabaseAccountKind
+    return {
+        CosmosAPIType.SQL: DatabaseAccountKind.GLOBAL_DOCUMENT_DB,
+        CosmosAPIType.MONGO: DatabaseAccountKind.MONGO_DB,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _api_props() -> Dict[CosmosAPIType, Optional[ApiProperties]]:
+    """API type -> API-specific create properties, built on first use."""
+    from azure.mgmt.cosmosdb.models import ApiProperties
+    return {
+        CosmosAPIType.SQL: None,
+        CosmosAPIType.MONGO: ApiProperties(server_version="3.2"),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _params_for(
+        location: str,
+        api_type: CosmosAPIType,
+) -> DatabaseAccountCreateUpdateParameters:
+    """
+    Returns the create parameters for a region/API type pair. The SDK
+    only serializes the body, so one instance is shared across requests.
+    """
+    from azure.mgmt.cosmosdb.models import (
+        DatabaseAccountCreateUpdateParameters,
+        Location,
+    )
+    return DatabaseAccountCreateUpdateParameters(
+        location=location,
+        kind=_kind_map()[api_type],
+        locations=[Location(
+            location_name=location,
+            failover_priority=0
+        )],
+        database_account_offer_type="Standard",
+        api_properties=_api_props()[api_type],
+    )
+
+# result type of a call queued on ArmBatchExecutor
+_T = TypeVar("_T")
+
+# refresh cached tokens this many seconds before they expire
+_TOKEN_REFRESH_MARGIN = 300
+
+# ARM connection pool: default concurrent sockets, DNS cache lifetime (seconds)
+_ARM_POOL_LIMIT = 100
+_ARM_DNS_CACHE_TTL = 300
+
+
+class _CachedTokenCredential:
+    """
+    Wraps an AsyncTokenCredential and caches tokens per scope set until
+    shortly before expiry, so AzureCliCredential only runs `az` when a
+    token actually needs refreshing.
+    """
+    def __init__(self, credential: AsyncTokenCredential) -> None:
+        self._credential = credential
+        self._tokens: Dict[Tuple[str, ...], AccessToken] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        """Returns a cached token for the scopes, fetching a new one if needed."""
+        if kwargs.get("claims") or kwargs.get("tenant_id"):
+            return await self._credential.get_token(*scopes, **kwargs)
+        async with self._lock:
+            token = self._tokens.get(scopes)
+            if token is None or token.expires_on - _TOKEN_REFRESH_MARGIN <= time.time():
+                token = await self._credential.get_token(*scopes, **kwargs)
+                self._tokens[scopes] = token
+            return token
+
+    async def close(self) -> None:
+        """Closes the wrapped credential."""
+        await self._credential.close()
+
+    async def __aenter__(self) -> "_CachedTokenCredential":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+_shared_lock = threading.Lock()
+# (subscription id, id(credential)) -> management client; the cached client
+# holds the credential, so its id cannot be reused while the entry exists
+_client_cache: Dict[Tuple[str, int], CosmosDBManagementClient] = {}
+_shared_credential: Optional[_CachedTokenCredential] = None
+_shared_transport: Optional[AioHttpTransport] = None
+
+
+def _get_shared_credential() -> AsyncTokenCredential:
+    """Returns the process-wide token-caching AzureCliCredential."""
+    global _shared_credential
+    with _shared_lock:
+        if _shared_credential is None:
+            from azure.identity.aio import AzureCliCredential
+            _shared_credential = _CachedTokenCredential(AzureCliCredential())
+        return _shared_credential
+
+
+def _get_shared_transport(pool_size: int = _ARM_POOL_LIMIT) -> AioHttpTransport:
+    """
+    Returns the process-wide aiohttp transport with a keep-alive pool
+    sized for concurrent LRO polling against management.azure.com.
+    Must be first called on the running event loop (the session binds to it).
+    Args:
+        pool_size: Maximum pooled connections; only used when the
+            transport is first created
+    """
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            import aiohttp
+            from azure.core.pipeline.transport import AioHttpTransport
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                ttl_dns_cache=_ARM_DNS_CACHE_TTL,
+                force_close=False,
+                enable_cleanup_closed=True,
+            )
+            # same session options AioHttpTransport uses for its own session
+            session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+                trust_env=True,
+            )
+            _shared_transport = AioHttpTransport(session=session, session_owner=True)
+        return _shared_transport
+
+
+class LroMux:
+    """
+    Drives all outstanding ARM long-running operations from one task:
+    every `interval` seconds each pending poller's status is refreshed
+    with one GET, all GETs issued together over the shared transport,
+    instead of every operation running its own polling loop.
+    Attributes:
+        interval: Seconds between polling rounds
+        max_concurrency: Maximum ARM GETs in flight (status polls and
+            final result fetches together)
+    """
+    def __init__(self, interval: float = 10.0, max_concurrency: int = 8) -> None:
+        self.interval = interval
+        self.max_concurrency = max_concurrency
+        self._pending: Dict[AsyncLROPoller[Any], asyncio.Future[Any]] = {}
+        self._worker: Optional[asyncio.Task[None]] = None
+        # result() calls for finished operations (final GET)
+        self._finishing: Set[asyncio.Task[None]] = set()
+
+    def watch(self, poller: AsyncLROPoller[Any]) -> asyncio.Future[Any]:
+        """
+        Registers a poller for the shared polling loop.
+        Args:
+            poller: Poller returned by a begin_* call
+        Returns:
+            Future resolved with poller.result() once the operation ends.
+        """
+        method = poller.polling_method()
+        if not isinstance(method, AsyncLROBasePolling) or method.finished():
+            # nothing to multiplex (no-polling / already finished)
+            return asyncio.ensure_future(poller.result())
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending[poller] = future
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._worker = loop.create_task(self._run())
+        return future
+
+    async def close(self) -> None:
+        """Stops the polling task and final result fetches; pending futures are cancelled."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        finishing = list(self._finishing)
+        for task in finishing:
+            task.cancel()
+        await asyncio.gather(*finishing, return_exceptions=True)
+        self._finishing.clear()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    @staticmethod
+    async def _advance(poller: AsyncLROPoller[Any], limit: asyncio.Semaphore) -> bool:
+        """Refreshes one operation's status; returns True once it has ended."""
+        # watch() only hands over pollers driven by AsyncLROBasePolling
+        method = cast(AsyncLROBasePolling, poller.polling_method())
+        async with limit:
+            await method.update_status()
+        return method.finished()
+
+    async def _finish(
+            self,
+            poller: AsyncLROPoller[Any],
+            future: asyncio.Future[Any],
+            limit: asyncio.Semaphore,
+    ) -> None:
+        """Collects the final result of an ended operation."""
+        try:
+            async with limit:
+                result = await poller.result()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self) -> None:
+        """Polling loop; exits once nothing is pending."""
+        loop = asyncio.get_running_loop()
+        # shared by this loop's status polls and final result fetches
+        limit = asyncio.Semaphore(self.max_concurrency)
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            batch = list(self._pending.items())
+            results: List[Any] = await asyncio.gather(
+                *(self._advance(poller, limit) for poller, _ in batch),
+                return_exceptions=True,
+            )
+            for (poller, future), result in zip(batch, results):
+                if future.done():
+                    self._pending.pop(poller, None)
+                elif isinstance(result, BaseException) or result:
+                    # failed polls go through result() too, which raises the
+                    # SDK's HttpResponseError rather than its internal errors
+                    self._pending.pop(poller, None)
+                    task = loop.create_task(self._finish(poller, future, limit))
+                    self._finishing.add(task)
+                    task.add_done_callback(self._finishing.discard)
+
+
+_lro_mux = LroMux()
+
+
+def configure_lro_polling(max_concurrency: int) -> None:
+    """
+    Sets how many ARM GETs the shared LroMux issues at once.
+    Takes effect when its polling task next starts.
+    Args:
+        max_concurrency: Maximum concurrent status/result GETs
+    """
+    _lro_mux.max_concurrency = max_concurrency
+
+
+def watch_lro(poller: AsyncLROPoller[Any]) -> asyncio.Future[Any]:
+    """Waits on an ARM long-running operation via the shared LroMux."""
+    return _lro_mux.watch(poller)
+
+
+def _get_shared_client(
+        subscription_id: str,
+        credential: AsyncTokenCredential,
+        pool_size: int = _ARM_POOL_LIMIT,
+) -> CosmosDBManagementClient:
+    """Returns the management client for a subscription/credential pair."""
+    key = (subscription_id, id(credential))
+    client = _client_cache.get(key)
+    if client is None:
+        from azure.mgmt.cosmosdb.aio import CosmosDBManagementClient
+        transport = _get_shared_transport(pool_size)
+        with _shared_lock:
+            client = _client_cache.get(key)
+            if client is None:
+                client = CosmosDBManagementClient(
+                    credential,
+                    subscription_id,
+                    transport=transport,
+                )
+                _client_cache[key] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Closes the shared LRO poller, clients, HTTP transport and credential (app shutdown)."""
+    global _shared_credential, _shared_transport
+    await _lro_mux.close()
+    with _shared_lock:
+        # the clients only wrap the shared transport/credential closed below
+        _client_cache.clear()
+        credential, transport = _shared_credential, _shared_transport
+        _shared_credential = None
+        _shared_transport = None
+    if transport is not None:
+        await transport.close()
+    if credential is not None:
+        await credential.close()
+
+
+class ArmBatchExecutor:
+    """
+    Coalesces ARM `begin_*` calls that arrive within a short window and
+    starts them together with asyncio.gather, so a burst of requests
+    shares the warm connection pool instead of trickling out one by one.
+    Attributes:
+        max_batch: Maximum number of calls started together
+        max_wait: Seconds to wait for more calls after the first one arrives
+    """
+    def __init__(self, max_batch: int = 64, max_wait: float = 0.02) -> None:
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue[Tuple[Callable[[], Awaitable[Any]], asyncio.Future[Any]]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    async def submit(self, start: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Queues an ARM call for the next batch and waits for its result.
+        Args:
+            start: Zero-argument callable returning the awaitable to run
+        Returns:
+            Whatever the awaitable returns (e.g. an AsyncLROPoller).
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        if (queue is None or self._worker is None or self._worker.done()
+                or self._worker.get_loop() is not loop):
+            queue = self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(queue))
+        future: asyncio.Future[Any] = loop.create_future()
+        queue.put_nowait((start, future))
+        return cast(_T, await future)
+
+    async def close(self) -> None:
+        """Stops the batching worker; calls still queued are cancelled."""
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        self._queue = None
+        if worker is None:
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        while queue is not None and not queue.empty():
+            queue.get_nowait()[1].cancel()
+
+    @staticmethod
+    async def _invoke(start: Callable[[], Awaitable[Any]]) -> Any:
+        return await start()
+
+    async def _run(
+            self,
+            queue: "asyncio.Queue[Tuple[Callable[[], Awaitable[Any]], asyncio.Future[Any]]]",
+    ) -> None:
+        """Worker loop: collect one window of calls, start them together."""
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            results: List[Any] = await asyncio.gather(
+                *(self._invoke(start) for start, _ in batch),
+                return_exceptions=True,
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
 class AzureCosmosManager:
     """Manages Azure Cosmos DB account lifecycle operations with async support.
     Attributes:
         subscription_id: Azure subscription identifier
         resource_group: Azure resource group name
         credential: Azure authentication credential
-        client: Cosmos DB Management client
+        client: Cosmos DB Management client (shared per subscription/credential)
+        settings: Application configuration settings
     """
     def __init__(
             self,
             subscription_id: str,
             resource_group: str,
-            credential: TokenCredential=None,
+            credential: Optional[AsyncTokenCredential]=None,
+            settings: Optional[Settings]=None,
     ):
         """Initializes AzureCosmosManager
         Args:
             subscription_id: Azure subscription identifier
             resource_group: Azure resource group name
-            credential: Azure authentication credential(default: AzureCliCredential)
+            credential: Azure authentication credential(default: shared, token-caching AzureCliCredential)
+            settings: Application configuration settings(default: get_settings())
         """
+        self.settings = settings or get_settings()
         self.subscription_id = subscription_id
         self.resource_group = resource_group
-        self.credential = credential or AzureCliCredential()
-        self.client = CosmosDBManagementClient(
-            self.credential,
+        self.credential = credential or _get_shared_credential()
+        self.client = _get_shared_client(
             self.subscription_id,
+            self.credential,
+            self.settings.AZURE_HTTP_POOL_SIZE,
         )
-    def _map_api_type(self, api_type: CosmosAPIType) -> DatabaseAccountKind:
-        """Maps our API type enum to Azure SDK Enum."""
-        return {
-            CosmosAPIType.SQL: DatabaseAccountKind.GLOBAL_DOCUMENT_DB,
-            CosmosAPIType.MONGO: DatabaseAccountKind.MONGO_DB,
-        }[api_type]
-    def _get_api_properties(self, api_type: CosmosAPIType) -> Optional[ApiProperties]:
-        """Returns API-specific properties for account creation."""
-        if api_type == CosmosAPIType.MONGO:
-            return ApiProperties(server_version="3.2")
-        return None
-    def _create_status_response(
-            self,
-            account_name:str,
-            status: CosmosAccountStatus,
-            resp_message: Optional[str]=None) -> CosmosAccountStatusResponse:
-        """Creates a standardized CosmosDB status response."""
-        now = datetime.now()
-        return CosmosAccountStatusResponse(
-            account_name=account_name,
-            status=status,
-            created_at=now,
-            updated_at=now,
-            message=resp_message,
-        )
+        # keeps LRO completion tasks alive until they finish
+        self._pending: Set[asyncio.Future[Any]] = set()
+        self._batcher = ArmBatchExecutor()
+    async def close(self) -> None:
+        """Stops the ARM batching worker."""
+        await self._batcher.close()
+    def _track(self, task: "asyncio.Future[Any]") -> None:
+        """Holds a reference to a background task until it completes."""
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
     async def create_account_async(
             self,
             account_name: str,
             location: str,
             api_type: CosmosAPIType,
-    )->None:
-        """Asynchronously provisions a new Azure Cosmos DB account.
+    )->AsyncLROPoller[DatabaseAccountGetResults]:
+        """Asynchronously starts provisioning a new Azure Cosmos DB account.
         Args:
             account_name: Globally unique name of the Azure Cosmos DB account.(3-44 lowercase alphanumeric chars)
             location: Azure region (e.g., 'Central India')
             api_type: CosmosDB API type
+        Returns:
+            Poller for the long-running create operation; await its result()
+            to wait for provisioning to finish.
         Raises:
             AzureError: If Azure SDK operation fails
         """
         try:
-            #map API type to Azure SDK Enum
-            kind = self._map_api_type(api_type)
-
-            #Prepare account creation Parameters
-            create_params = DatabaseAccountCreateUpdateParameters(
-                location=location,
-                kind=kind,
-                locations=[Location(
-                    location_name=location,
-                    failover_priority=0
-                )],
-                database_account_offer_type="Standard",
-                api_properties=self._get_api_properties(api_type),
-            )
-            #start async provisioning using thread pool executor
-            def sync_create_and_wait():
-                poller = self.client.database_accounts.begin_create_or_update(
-                    resource_group_name=self.resource_group,
-                    account_name=account_name,
-                    create_update_parameters=create_params
-                )
-                return poller.result()
-            future = asyncio.get_event_loop().run_in_executor(None, sync_create_and_wait)
-            def callback(fut: asyncio.Future[None])->None:
-                try:
-                    fut.result()
-                    StatusTracker.update_status(
-                        account_name=account_name,
-                        status=CosmosAccountStatus.COMPLETED,
-                        message="Provisioning completed successfully"
-                    )
-                    app.services.email_templates.send_success_notification(
-                        account_name,
-                        api_type,
-                        location,
-                        get_settings()
-                    )
-                except Exception as e:
-                    logger.error(str(e))
-                    StatusTracker.update_status(
-                        account_name=account_name,
-                        status=CosmosAccountStatus.ERROR,
-                        message=str(e),
-                    )
-                    app.services.email_templates.send_failure_notification(
-                        account_name,
-                        str(e),
-                        get_settings()
-                    )
-            future.add_done_callback(callback)
+            #cached per (location, api_type)
+            create_params = _params_for(location, api_type)
+            #start async provisioning on the aio client
+            poller = await self._batcher.submit(functools.partial(
+                self.client.database_accounts.begin_create_or_update,
+                resource_group_name=self.resource_group,
+                account_name=account_name,
+                create_update_parameters=create_params
+            ))
+            return poller
 
         except AzureError as err:
-            logger.error(err.message)
-            raise Exception(">>> Error: " + str(err) + " <<<")
+            # re-raised as-is so callers keep the SDK error type and details
+            logger.error("%s", err.message)
+            raise
 
-    def get_account_async(self, account_name: str)->Optional[DatabaseAccountGetResults]:
+    async def get_account_async(self, account_name: str)->Optional[DatabaseAccountGetResults]:
         """Asynchronously retrieves an Azure Cosmos DB account."""
         try:
-            return self.client.database_accounts.get(
+            return await self.client.database_accounts.get(
                 self.resource_group,
                 account_name
             )
         except AzureError as e:
-            logger.error(e)
+            logger.error("%s", e)
             return None
 
-    def account_exists(self, account_name:str)->bool:
+    async def account_exists(self, account_name:str)->bool:
         """Checks if an account exists."""
-        account = self.get_account_async(account_name)
+        account = await self.get_account_async(account_name)
         return account is not None
 
+    async def _complete_deletion(
+            self,
+            account_name: str,
+            result: Awaitable[Any],
+            settings: Settings,
+    ) -> None:
+        """Waits for a deletion LRO, then records its status and sends the email."""
+        try:
+            await result
+        except Exception as e:
+            logger.error("%s", e)
+            await StatusTracker.update_status_async(
+                account_name=account_name,
+                status=CosmosAccountStatus.ERROR,
+                message=str(e),
+            )
+            await run_notification(
+                app.services.email_templates.send_deletion_failure_email,
+                account_name,
+                str(e),
+                settings
+            )
+        else:
+            await StatusTracker.update_status_async(
+                account_name=account_name,
+                status=CosmosAccountStatus.COMPLETED,
+                message="Deleting completed successfully"
+            )
+            await run_notification(
+                app.services.email_templates.send_deletion_success_email,
+                account_name,
+                settings
+            )
+
     async def delete_account_async(self, account_name: str)->None:
-        """Asynchronously deletes an Azure Cosmos DB account."""
-        if not self.account_exists(account_name):
-            raise ValueError(f"Account {account_name} does not exist.")
+        """Asynchronously deletes an Azure Cosmos DB account.
+        Raises:
+            AccountNotFound: If the account does not exist (ARM returned 404)
+            AzureError: If ARM rejects the delete for any other reason
+        """
         try:
-            #start async provisioning using thread pool executor
-            #start async provisioning using thread pool executor
-            def sync_create_and_wait():
-                poller = self.client.database_accounts.begin_delete(
-                    resource_group_name=self.resource_group,
-                    account_name=account_name,
-                )
-                return poller.result()
-            future = asyncio.get_event_loop().run_in_executor(None, sync_create_and_wait)
-            def callback(fut: asyncio.Future[None])->None:
-                try:
-                    fut.result()
-                    StatusTracker.update_status(
-                        account_name=account_name,
-                        status=CosmosAccountStatus.COMPLETED,
-                        message="Deleting completed successfully"
-                    )
-                    app.services.email_templates.send_deletion_success_email(
-                        account_name,
-                        get_settings()
-                    )
-                except Exception as e:
-                    logger.error(str(e))
-                    StatusTracker.update_status(
-                        account_name=account_name,
-                        status=CosmosAccountStatus.ERROR,
-                        message=str(e),
-                    )
-                    app.services.email_templates.send_deletion_failure_email(
-                        account_name,
-                        str(e),
-                        get_settings()
-                    )
-            future.add_done_callback(callback)
-            # poller = await asyncio.get_event_loop().run_in_executor(
-            #     None,
-            #     lambda: self.client.database_accounts.begin_delete(
-            #         resource_group_name=self.resource_group,
-            #         account_name=account_name,
-            #     ),
-            # )
-            # def callback(fut: asyncio.Future[None])->None:
-            #     if fut.exception():
-            #         logger.error(fut.exception())
-            #         StatusTracker.update_status(
-            #             account_name=account_name,
-            #             status=CosmosAccountStatus.ERROR,
-            #             message=str(fut.exception())
-            #         )
-            #         app.services.email_templates.send_deletion_failure_email(account_name, str(fut.exception()), get_settings())
-            #     else:
-            #         StatusTracker.update_status(
-            #             account_name=account_name,
-            #             status=CosmosAccountStatus.COMPLETED,
-            #             message="Delete completed successfully"
-            #         )
-            #         app.services.email_templates.send_deletion_success_email(
-            #             account_name,
-            #             get_settings()
-            #         )
-            # poller.add_done_callback(callback)
+            #start async deletion on the aio client
+            poller = await self._batcher.submit(functools.partial(
+                self.client.database_accounts.begin_delete,
+                resource_group_name=self.resource_group,
+                account_name=account_name,
+            ))
+            # returns now; the outcome is recorded when the LRO ends
+            self._track(asyncio.create_task(
+                self._complete_deletion(account_name, watch_lro(poller), self.settings)
+            ))
+        except ResourceNotFoundError:
+            # begin_delete's 404 replaces a separate GET existence check
+            raise AccountNotFound(f"Account {account_name} does not exist.")
         except AzureError as err:
-            logger.error(err.message)
-            raise Exception(">>> Error: " + str(err) + " <<<")
+            # re-raised as-is: the router sends the failure email for it
+            # and app.main's AzureError handler formats the 500
+            logger.error("%s", err.message)
+            raise
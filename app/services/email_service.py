@@ -1,6 +1,183 @@
+import asyncio
+import functools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Callable, Final, Optional
 from app.core.config.settings import Settings
-from app.services.gmail_sender import GmailSender
+from app.services.gmail_sender import AsyncGmailSender, GmailSenderPool
 from app.services.logging_service import logger
+
+_gmail_pool: Optional[GmailSenderPool] = None
+_gmail_pool_lock = threading.Lock()
+
+# max emails handed to the SMTP thread in one go
+_MAIL_BATCH_SIZE: Final[int] = 20
+
+# SMTP work runs here instead of the default executor shared with
+# FastAPI's sync endpoints/dependencies
+_mail_executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="smtp",
+)
+
+# with aiosmtplib installed the mail worker sends on the event loop itself
+_HAS_AIOSMTPLIB: Final[bool] = importlib.util.find_spec("aiosmtplib") is not None
+
+_mail_queue: Optional["asyncio.Queue[tuple[str, str, Settings]]"] = None
+_mail_loop: Optional[asyncio.AbstractEventLoop] = None
+_mail_worker: Optional["asyncio.Task[None]"] = None
+_async_sender: Optional[AsyncGmailSender] = None
+
+
+def get_gmail_pool(settings: Settings) -> GmailSenderPool:
+    """
+    Returns the process-wide pool of SMTP sessions. Sessions are
+    connected on first use and reused across emails (one TLS
+    handshake + login per pooled session rather than per email).
+    Args:
+        settings: Application configuration with email details
+    Returns:
+        GmailSenderPool sized by settings.SMTP_POOL_SIZE.
+    """
+    global _gmail_pool
+    with _gmail_pool_lock:
+        if _gmail_pool is None:
+            _gmail_pool = GmailSenderPool(settings, size=settings.SMTP_POOL_SIZE)
+        return _gmail_pool
+
+
+def close_gmail_sender() -> None:
+    """Closes the pooled SMTP connections, if any are open."""
+    global _gmail_pool
+    with _gmail_pool_lock:
+        pool, _gmail_pool = _gmail_pool, None
+    if pool is not None:
+        try:
+            pool.close()
+        except Exception as e:
+            logger.error("Closing SMTP connection failed: %s", e)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Returns the event loop running in this thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _deliver(
+        subject: str,
+        body: str,
+        settings: Settings
+) -> None:
+    """Sends one email over a pooled SMTP session, logging failures."""
+    try:
+        with get_gmail_pool(settings).acquire() as sender:
+            result = sender.send(
+                to=settings.GMAIL_ADDRESS,
+                subject=subject,
+                body=body,
+            )
+            if not result["success"]:
+                # raising inside acquire() drops the session from the pool
+                raise RuntimeError(result["error"])
+    except Exception as e:
+        logger.error("Email notification failed: %s", e)
+
+
+def _deliver_batch(batch: list[tuple[str, str, Settings]]) -> None:
+    """Sends a batch of queued emails over pooled SMTP sessions."""
+    for subject, body, settings in batch:
+        _deliver(subject, body, settings)
+
+
+async def _deliver_batch_async(batch: list[tuple[str, str, Settings]]) -> None:
+    """Sends a batch of queued emails over the worker's aiosmtplib session."""
+    global _async_sender
+    for subject, body, settings in batch:
+        if _async_sender is None or _async_sender.settings != settings:
+            if _async_sender is not None:
+                await _async_sender.disconnect()
+            _async_sender = AsyncGmailSender(settings)
+        try:
+            await _async_sender.send(
+                to=settings.GMAIL_ADDRESS,
+                subject=subject,
+                body=body,
+            )
+        except Exception as e:
+            logger.error("Email notification failed: %s", e)
+
+
+async def _drain_mail_queue(
+        queue: "asyncio.Queue[tuple[str, str, Settings]]",
+) -> None:
+    """Consumer coroutine that sends queued emails in batches."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAIL_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            if _HAS_AIOSMTPLIB:
+                await _deliver_batch_async(batch)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    _mail_executor, _deliver_batch, batch
+                )
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def run_notification(notifier: Callable[..., None], *args: Any) -> None:
+    """Runs a notifier on the SMTP executor and waits for it to finish."""
+    await asyncio.get_running_loop().run_in_executor(
+        _mail_executor, functools.partial(notifier, *args)
+    )
+
+
+async def start_mail_worker() -> None:
+    """
+    Starts the background consumer for queued emails on the running loop.
+    Called from the FastAPI lifespan.
+    """
+    global _mail_queue, _mail_loop, _mail_worker
+    _mail_queue = asyncio.Queue()
+    _mail_loop = asyncio.get_running_loop()
+    _mail_worker = asyncio.create_task(_drain_mail_queue(_mail_queue))
+
+
+async def stop_mail_worker() -> None:
+    """Stops accepting new emails, sends what is queued and stops the consumer."""
+    global _mail_queue, _mail_loop, _mail_worker
+    queue, worker = _mail_queue, _mail_worker
+    _mail_loop = None
+    if queue is None or worker is None:
+        return
+    # let puts already scheduled from worker threads land first
+    await asyncio.sleep(0)
+    await queue.join()
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
+    _mail_queue = None
+    _mail_worker = None
+    await _close_async_sender()
+
+
+async def _close_async_sender() -> None:
+    """Closes the mail worker's aiosmtplib session, if one is open."""
+    global _async_sender
+    sender, _async_sender = _async_sender, None
+    if sender is not None:
+        try:
+            await sender.disconnect()
+        except Exception as e:
+            logger.error("Closing SMTP connection failed: %s", e)
+
+
 def send_email(
         subject: str,
         body: str,
@@ -8,17 +185,29 @@ def send_email(
 ) -> None:
     """
     Send email notification using Gmail API.
+    When the mail worker is running the email is queued and sent in a
+    batch by the worker; otherwise it is sent on the SMTP executor when
+    called from an event loop, and inline from any other thread.
     Args:
         subject: Email subject
         body: Email body
         settings: Application configuration with email details
     """
-    try:
-        with GmailSender(settings) as email_sender:
-            email_sender.send(
-                to=settings.GMAIL_ADDRESS,
-                subject=subject,
-                body=body,
-            )
-    except Exception as e:
-        logger.error(f"Email notification failed: {str(e)}")
+    loop, queue = _mail_loop, _mail_queue
+    current = _running_loop()
+    if loop is not None and queue is not None:
+        item = (subject, body, settings)
+        if current is loop:
+            queue.put_nowait(item)
+            return
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+            return
+        except RuntimeError:
+            # loop already closed, fall back to sending directly
+            pass
+    if current is not None:
+        # never block an event loop thread on SMTP
+        _mail_executor.submit(_deliver, subject, body, settings)
+        return
+    _deliver(subject, body, settings)
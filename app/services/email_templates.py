@@ -1,12 +1,70 @@
+from functools import lru_cache
+from typing import Final
 from app.models.custom_types import CosmosAPIType
 from app.core.config.settings import Settings
-from datetime import datetime
+from datetime import datetime, timezone
 from app.services.email_service import send_email
+
+# Static email bodies are plain str.format templates defined once at
+# import; only the dynamic fields are substituted per notification.
+_PORTAL_PREFIX_TMPL: Final[str] = (
+    "https://portal.azure.com/#resource/subscriptions/{subscription_id}"
+    "/resourceGroups/{resource_group}"
+    "/providers/Microsoft.DocumentDB/databaseAccounts/"
+)
+
+_SUCCESS_BODY_TMPL: Final[str] = """Your Azure Cosmos DB account has been successfully provisioned!
+
+Account Details:
+• Name: {account_name}
+• API Type: {api_type}
+• Location: {location}
+• Provisioning Time: {timestamp}
+
+Next Steps:
+1. Create databases and containers
+2. Configure access policies
+3. Connect using connection strings
+
+Azure Portal Link: {portal_url}
+"""
+
+_FAILURE_BODY_TMPL: Final[str] = """CosmosDB account provisioning failed:
+Account Name: {account_name}
+Error: {error_message}
+Required Action:
+1. Check Azure portal for resource status.
+2. Check detail.log file for errors
+3. Review account name availability
+4. Ensure location selected is available for your account at this time.
+Provisioning failed for {account_name} with error: {error_message}"""
+
+_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M UTC"
+
+_DELETE_OK_TMPL: Final[str] = (
+    "Your Azure Cosmos DB account {account_name} has been successfully deleted."
+)
+
+_DELETE_FAIL_TMPL: Final[str] = (
+    "Failed to delete Cosmos DB account {account_name}. Error: {error_message}"
+)
+
+
+@lru_cache(maxsize=4)
+def _portal_url_prefix(settings: Settings) -> str:
+    """Portal URL up to the account name; built once per Settings instance."""
+    return _PORTAL_PREFIX_TMPL.format_map({
+        "subscription_id": settings.AZURE_SUBSCRIPTION_ID,
+        "resource_group": settings.AZURE_RESOURCE_GROUP,
+    })
+
+
 def send_success_notification(
         account_name: str,
         api_type: CosmosAPIType,
         location: str,
-        settings: Settings
+        settings: Settings,
+        completed_at: datetime,
 ) -> None:
     """
     Send success email notification with account details.
@@ -16,23 +74,18 @@ def send_success_notification(
         api_type: Cosmos DB API type used
         location: Azure region where account was created
         settings: Application configuration with email details
+        completed_at: When provisioning completed (the status record's updated_at)
     """
     subject =  f"✅ Cosmos DB Account Ready: {account_name}"
-    body=f"""Your Azure Cosmos DB account has been successfully provisioned!
-
-            Account Details:
-            • Name: {account_name}
-            • API Type: {api_type.value}
-            • Location: {location}
-            • Provisioning Time: {datetime.now().strftime("%Y-%m-%d %H:%M UTC")}
-
-            Next Steps:
-            1. Create databases and containers
-            2. Configure access policies
-            3. Connect using connection strings
-
-            Azure Portal Link: https://portal.azure.com/#resource/subscriptions/{settings.AZURE_SUBSCRIPTION_ID}/resourceGroups/{settings.AZURE_RESOURCE_GROUP}/providers/Microsoft.DocumentDB/databaseAccounts/{account_name}
-            """
+    timestamp = completed_at.astimezone(timezone.utc).strftime(_TIMESTAMP_FORMAT)
+    portal_url = _portal_url_prefix(settings) + account_name
+    body = _SUCCESS_BODY_TMPL.format_map({
+        "account_name": account_name,
+        "api_type": api_type.value,
+        "location": location,
+        "timestamp": timestamp,
+        "portal_url": portal_url,
+    })
     send_email(subject, body, settings)
 
 
@@ -50,7 +103,10 @@ def send_deletion_failure_email(
         settings: Application configuration with email details
     """
     subject=f"❌ Cosmos DB Account Deletion Failed: {account_name}"
-    body=f"""Failed to delete Cosmos DB account {account_name}. Error: {error_message}"""
+    body=_DELETE_FAIL_TMPL.format_map({
+        "account_name": account_name,
+        "error_message": error_message,
+    })
     send_email( subject, body, settings)
 
 def send_deletion_success_email(
@@ -65,7 +121,7 @@ def send_deletion_success_email(
         settings: Application configuration with email details
     """
     subject=f"✅ Cosmos DB Account Deleted: {account_name}"
-    body=f"Your Azure Cosmos DB account {account_name} has been successfully deleted."
+    body=_DELETE_OK_TMPL.format_map({"account_name": account_name})
     send_email(subject, body, settings)
 
 def send_failure_notification(
@@ -75,13 +131,8 @@ def send_failure_notification(
 ) -> None:
     """Send email notification on provisioning failure"""
     subject:str = f"Provisioning failed for {account_name}"
-    body: str= f"""CosmosDB account provisioning failed:
-                Account Name: {account_name}
-                Error: {error_message}
-                Required Action:
-                1. Check Azure portal for resource status.
-                2. Check detail.log file for errors
-                3. Review account name availability
-                4. Ensure location selected is available for your account at this time.
-                Provisioning failed for {account_name} with error: {error_message}"""
+    body: str= _FAILURE_BODY_TMPL.format_map({
+        "account_name": account_name,
+        "error_message": error_message,
+    })
     send_email(subject, body, settings)
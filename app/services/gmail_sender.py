@@ -1,9 +1,91 @@
-from typing import Optional, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, Tuple
+import asyncio
+import base64
+import queue
 import smtplib
+import threading
+import time
 from email.message import EmailMessage
 from app.core.config.settings import Settings
 from app.services.logging_service import logger
 
+_SMTP_HOST = "smtp.gmail.com"
+_SMTP_PORT = 587
+
+_GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+_GMAIL_SCOPE = "https://mail.google.com/"
+
+# (client id, refresh token) -> google.oauth2 Credentials holding the
+# current access token; refreshed only once it has expired
+_oauth_credentials: Dict[Tuple[str, str], Any] = {}
+_oauth_lock = threading.Lock()
+
+
+def _xoauth2_string(settings: Settings) -> Optional[str]:
+    """
+    Returns the base64 XOAUTH2 SASL string for the configured Gmail
+    OAuth client, or None when password login is configured instead.
+    The access token is cached per process and only refreshed (one
+    HTTPS call to Google) after it expires.
+    """
+    refresh_token = settings.GMAIL_OAUTH_REFRESH_TOKEN
+    if not refresh_token:
+        return None
+    client_id = settings.GMAIL_OAUTH_CLIENT_ID
+    if not client_id:
+        raise RuntimeError("GMAIL_OAUTH_CLIENT_ID is required with GMAIL_OAUTH_REFRESH_TOKEN")
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
+    key = (client_id, refresh_token)
+    with _oauth_lock:
+        credentials = _oauth_credentials.get(key)
+        if credentials is None:
+            credentials = Credentials(
+                None,
+                refresh_token=refresh_token,
+                token_uri=_GOOGLE_TOKEN_URI,
+                client_id=client_id,
+                client_secret=settings.GMAIL_OAUTH_CLIENT_SECRET,
+                scopes=[_GMAIL_SCOPE],
+            )
+            _oauth_credentials[key] = credentials
+        if not credentials.valid:
+            credentials.refresh(Request())
+        token = credentials.token
+    auth = f"user={settings.GMAIL_ADDRESS}\x01auth=Bearer {token}\x01\x01"
+    return base64.b64encode(auth.encode()).decode()
+
+
+def _password(settings: Settings) -> str:
+    """GMAIL_PASSWORD for plain login; settings validation requires it without OAuth."""
+    if not settings.GMAIL_PASSWORD:
+        raise RuntimeError("GMAIL_PASSWORD is required when Gmail OAuth is not configured")
+    return settings.GMAIL_PASSWORD
+
+
+def _build_message(
+        settings: Settings,
+        to: str,
+        subject: str,
+        body: str,
+        cc: Optional[str] = None,
+        bcc: Optional[str] = None,
+) -> EmailMessage:
+    """Builds a plain-text message from the configured Gmail address."""
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = settings.GMAIL_ADDRESS
+    message["To"] = to
+    if cc:
+        message["Cc"] = cc
+    if bcc:
+        message["Bcc"] = bcc
+    message.set_content(body)
+    return message
+
+
 class GmailSender:
     """
     Secure Gmail sender with TLS and type-safe config
@@ -14,10 +96,14 @@ class GmailSender:
         subject="Test email",
         body="This is a test email"
         )
+    A single instance can also be kept open and shared; sends are
+    serialized with a lock and a dropped connection is re-established
+    once before giving up.
     """
     def __init__(self, settings: Settings)-> None:
         self.settings = settings
         self.connection: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
 
     def __enter__(self) -> "GmailSender":
         """Context manager entry with TLS Handshake"""
@@ -28,14 +114,21 @@ class GmailSender:
         """Context manager exit with proper cleanup"""
         self.disconnect()
     def connect(self)->None:
-        """Connect to Gmail SMTP server with TLS"""
-        self.connection = smtplib.SMTP("smtp.gmail.com", 587)
+        """Connect to Gmail SMTP server with TLS; XOAUTH2 when configured, else password login"""
+        self.connection = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT)
         self.connection.ehlo()
         self.connection.starttls()
-        self.connection.login(
-            self.settings.GMAIL_ADDRESS,
-            self.settings.GMAIL_PASSWORD
-        )
+        sasl = _xoauth2_string(self.settings)
+        if sasl is None:
+            self.connection.login(
+                self.settings.GMAIL_ADDRESS,
+                _password(self.settings)
+            )
+            return
+        self.connection.ehlo()
+        code, response = self.connection.docmd("AUTH", "XOAUTH2 " + sasl)
+        if code != 235:
+            raise smtplib.SMTPAuthenticationError(code, response)
     def disconnect(self)->None:
         """Disconnect from Gmail SMTP server"""
         if self.connection:
@@ -59,25 +152,179 @@ class GmailSender:
         """
         if not self.connection:
             raise RuntimeError("Not connected to SMTP server")
-        message = EmailMessage()
-        message["Subject"] = subject
-        message["From"] = self.settings.GMAIL_ADDRESS
-        message["To"] = to
-        if cc:
-            message["Cc"] = cc
-        if bcc:
-            message["Bcc"] = bcc
-        message.set_content(body)
+        message = _build_message(self.settings, to, subject, body, cc, bcc)
         try:
-            self.connection.send_message(message)
+            with self._lock:
+                try:
+                    self.connection.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    logger.info("SMTP connection dropped, reconnecting")
+                    self.connect()
+                    self.connection.send_message(message)
             return {
                 "success": True,
                 "message_id" : message["Message-ID"],
                 "recipients": [to]+ ([cc] if cc else []) + ([bcc] if bcc else [])
             }
         except smtplib.SMTPException as e:
-            logger.error(f"Failed to send email: {str(e)}")
+            logger.error("Failed to send email: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+
+class AsyncGmailSender:
+    """
+    Gmail sender on aiosmtplib: TLS, login and sends run on the event
+    loop with non-blocking sockets, so no thread is needed per email.
+    Example usage:
+    sender = AsyncGmailSender(settings)
+    await sender.connect()
+    await sender.send(to="user@company.com", subject="Test", body="...")
+    One session is kept open; sends are serialized with an asyncio.Lock
+    (SMTP is one command at a time) and a dropped connection is
+    re-established once before giving up. aiosmtplib is optional and
+    imported on connect.
+    """
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self.connection: Any = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Connect to Gmail SMTP server with STARTTLS; XOAUTH2 when configured, else password login"""
+        import aiosmtplib
+
+        # only a fully authenticated session is kept on self.connection
+        connection = aiosmtplib.SMTP(hostname=_SMTP_HOST, port=_SMTP_PORT, start_tls=True)
+        await connection.connect()
+        try:
+            # a token refresh is a blocking HTTPS call, so keep it off the loop
+            sasl = await asyncio.to_thread(_xoauth2_string, self.settings)
+            if sasl is None:
+                await connection.login(
+                    self.settings.GMAIL_ADDRESS,
+                    _password(self.settings)
+                )
+            else:
+                response = await connection.execute_command(b"AUTH", b"XOAUTH2", sasl.encode())
+                if response.code != 235:
+                    raise aiosmtplib.SMTPAuthenticationError(response.code, response.message)
+        except BaseException:
+            connection.close()
+            raise
+        self.connection = connection
+
+    async def disconnect(self) -> None:
+        """Disconnect from Gmail SMTP server"""
+        import aiosmtplib
+
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            try:
+                await connection.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                connection.close()
+
+    async def send(self, to: str, subject: str, body: str, cc: Optional[str] = None, bcc: Optional[str]=None)->Dict[str, Any]:
+        """
+        Send an email; same arguments and result as GmailSender.send.
+        Connects on first use.
+        """
+        import aiosmtplib
+
+        message = _build_message(self.settings, to, subject, body, cc, bcc)
+        try:
+            async with self._lock:
+                if self.connection is None:
+                    await self.connect()
+                try:
+                    await self.connection.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    logger.info("SMTP connection dropped, reconnecting")
+                    self.connection = None
+                    await self.connect()
+                    await self.connection.send_message(message)
+            return {
+                "success": True,
+                "message_id" : message["Message-ID"],
+                "recipients": [to]+ ([cc] if cc else []) + ([bcc] if bcc else [])
+            }
+        except (aiosmtplib.SMTPException, OSError) as e:
+            logger.error("Failed to send email: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
+
+
+class GmailSenderPool:
+    """
+    Thread-safe pool of connected GmailSender sessions, so each email
+    borrows an open session instead of paying TLS + login again.
+    Example usage:
+    pool = GmailSenderPool(settings, size=2)
+    with pool.acquire() as sender:
+        sender.send(to="user@company.com", subject="Test", body="...")
+    Sessions idle for longer than `idle_check` seconds are probed with
+    NOOP before reuse; a session that fails the probe or raises while
+    borrowed is dropped and replaced on a later acquire.
+    """
+    def __init__(self, settings: Settings, size: int = 2, idle_check: float = 60.0) -> None:
+        self.settings = settings
+        self.size = size
+        self.idle_check = idle_check
+        self._idle: "queue.Queue[tuple[GmailSender, float]]" = queue.Queue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def acquire(self) -> Iterator[GmailSender]:
+        """Borrows a connected session, returning it to the pool afterwards."""
+        with self._slots:
+            sender = self._checkout()
+            try:
+                yield sender
+            except Exception:
+                self._discard(sender)
+                raise
+            # idle + borrowed never exceeds size, so this cannot block
+            self._idle.put_nowait((sender, time.monotonic()))
+
+    def close(self) -> None:
+        """Disconnects all idle sessions."""
+        while True:
+            try:
+                sender, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(sender)
+
+    def _checkout(self) -> GmailSender:
+        """Returns a healthy idle session, or connects a new one."""
+        while True:
+            try:
+                sender, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - idle_since < self.idle_check:
+                return sender
+            if sender.connection is None:
+                continue
+            try:
+                sender.connection.noop()
+                return sender
+            except (smtplib.SMTPException, OSError):
+                logger.info("Dropping stale SMTP connection")
+                self._discard(sender)
+        sender = GmailSender(self.settings)
+        sender.connect()
+        return sender
+
+    @staticmethod
+    def _discard(sender: GmailSender) -> None:
+        """Closes a session, ignoring errors from an already dead socket."""
+        try:
+            sender.disconnect()
+        except (smtplib.SMTPException, OSError):
+            sender.connection = None
@@ -1,4 +1,41 @@
 import logging.config
+import logging.handlers
+import queue
+from typing import Optional
 
-logging.config.fileConfig("logging.conf", disable_existing_loggers=False)
 logger = logging.getLogger(__name__)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(config_file: str = "logging.conf") -> None:
+    """
+    Loads handlers and formatters from the logging config file.
+    Called once per worker from the FastAPI lifespan instead of on import.
+    The configured handlers are moved behind a QueueHandler, so logging
+    calls on the event loop only enqueue the record; a QueueListener
+    thread does the stdout/file writes.
+    Args:
+        config_file: Path to the logging fileConfig file
+    """
+    global _listener
+    stop_logging()
+    logging.config.fileConfig(config_file, disable_existing_loggers=False)
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    _listener = logging.handlers.QueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flushes queued records and stops the listener thread (app shutdown)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
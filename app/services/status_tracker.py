@@ -1,16 +1,382 @@
-from datetime import datetime
-from typing import Optional, Dict
+import asyncio
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Final, Optional, Dict, List, Protocol, Tuple
 from app.models.custom_types import CosmosAccountStatus
 from app.models.cosmos_models import CosmosAccountStatusResponse
 
+# CosmosAccountStatus <-> small int code stored in the status array
+_STATUS_MEMBERS: Final[tuple[CosmosAccountStatus, ...]] = tuple(CosmosAccountStatus)
+_STATUS_CODES: Final[Dict[CosmosAccountStatus, int]] = {
+    member: code for code, member in enumerate(_STATUS_MEMBERS)
+}
+
+# number of independently locked shards in the in-memory store
+_SHARDS: Final[int] = 16
+
+# default bounds on tracked statuses (overridable through StatusTracker.configure)
+_DEFAULT_MAX_ENTRIES: Final[int] = 10_000
+_DEFAULT_TTL_SECONDS: Final[int] = 86400
+
+# Redis key prefix for shared status records
+_REDIS_KEY_PREFIX: Final[str] = "cosmos:status:"
+
+
+# status timestamps are reused for this long (1 ms) before re-reading the clock
+_NOW_TTL_NS: Final[int] = 1_000_000
+# (monotonic ns when read, UTC time read); swapped as one tuple
+_NOW_CACHE: Tuple[int, Optional[datetime]] = (0, None)
+
+
+def _now() -> datetime:
+    """
+    Returns the current UTC time, re-read at most once per millisecond so
+    bursts of status writes share one datetime instead of allocating their own.
+    """
+    global _NOW_CACHE
+    t = time.monotonic_ns()
+    read_at, cached = _NOW_CACHE
+    if cached is None or t - read_at > _NOW_TTL_NS:
+        cached = datetime.now(timezone.utc)
+        _NOW_CACHE = (t, cached)
+    return cached
+
+
+class _Columns:
+    """
+    Parallel arrays (structure of arrays) indexed by a per-account slot.
+    Attributes:
+        index(Dict[str, int]): account name -> slot in the arrays below.
+        status(array): CosmosAccountStatus code per slot.
+        created(array): created_at as epoch seconds per slot.
+        updated(array): updated_at as epoch seconds per slot.
+        messages(List[Optional[str]]): status message per slot.
+        json(List[Optional[bytes]]): serialized response per slot,
+            filled on first read and dropped on the next write.
+    """
+    __slots__ = ("index", "status", "created", "updated", "messages", "json")
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.status = array("B")
+        self.created = array("d")
+        self.updated = array("d")
+        self.messages: List[Optional[str]] = []
+        self.json: List[Optional[bytes]] = []
+
+    def append(self, account_name: str, code: int, created: float, updated: float,
+               message: Optional[str], payload: Optional[bytes] = None) -> None:
+        # fill the slot before publishing it in the index
+        self.status.append(code)
+        self.created.append(created)
+        self.updated.append(updated)
+        self.messages.append(message)
+        self.json.append(payload)
+        self.index[account_name] = len(self.messages) - 1
+
+
+class _StatusShard:
+    """
+    One shard of the in-memory store. Writes take the shard lock; reads
+    do not, and see either the current columns or the ones replaced by
+    the last eviction, never a mix.
+    Entries older than `ttl` seconds are not returned, and once the shard
+    holds `max_entries` accounts, expired and least recently updated
+    entries are dropped (down to 3/4 full) before adding another.
+    """
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cols = _Columns()
+
+    def write(
+            self,
+            account_name: str,
+            status: CosmosAccountStatus,
+            message: Optional[str],
+            now: datetime,
+    ) -> CosmosAccountStatusResponse:
+        code = _STATUS_CODES[status]
+        updated = now.timestamp()
+        created_at = now
+        with self._lock:
+            cols = self._cols
+            slot = cols.index.get(account_name)
+            if slot is None:
+                if len(cols.messages) >= self.max_entries:
+                    cols = self._evict()
+                cols.append(account_name, code, updated, updated, message)
+            else:
+                if cols.updated[slot] > updated - self.ttl:
+                    # same account still tracked: keep when it was first seen
+                    created_at = datetime.fromtimestamp(cols.created[slot], timezone.utc)
+                else:
+                    cols.created[slot] = updated
+                cols.status[slot] = code
+                cols.updated[slot] = updated
+                cols.messages[slot] = message
+                cols.json[slot] = None
+        return CosmosAccountStatusResponse.model_construct(
+            account_name=account_name,
+            status=status,
+            created_at=created_at,
+            updated_at=now,
+            message=message
+        )
+
+    def _evict(self) -> _Columns:
+        """Rebuilds the columns without expired/oldest entries and swaps them in."""
+        old = self._cols
+        cutoff = time.time() - self.ttl
+        live = sorted(
+            (slot for slot in old.index.values() if old.updated[slot] > cutoff),
+            key=old.updated.__getitem__,
+            reverse=True,
+        )[: self.max_entries * 3 // 4]
+        names = {slot: name for name, slot in old.index.items()}
+        cols = _Columns()
+        for slot in reversed(live):
+            cols.append(names[slot], old.status[slot], old.created[slot],
+                        old.updated[slot], old.messages[slot], old.json[slot])
+        self._cols = cols
+        return cols
+
+    def _slot(self, account_name: str) -> tuple[_Columns, Optional[int]]:
+        """Returns the current columns and the account's live slot, if any."""
+        cols = self._cols
+        slot = cols.index.get(account_name)
+        if slot is not None and cols.updated[slot] <= time.time() - self.ttl:
+            slot = None
+        return cols, slot
+
+    @staticmethod
+    def _record(cols: _Columns, slot: int, account_name: str) -> CosmosAccountStatusResponse:
+        return CosmosAccountStatusResponse.model_construct(
+            account_name=account_name,
+            status=_STATUS_MEMBERS[cols.status[slot]],
+            created_at=datetime.fromtimestamp(cols.created[slot], timezone.utc),
+            updated_at=datetime.fromtimestamp(cols.updated[slot], timezone.utc),
+            message=cols.messages[slot]
+        )
+
+    def read(self, account_name: str) -> Optional[CosmosAccountStatusResponse]:
+        cols, slot = self._slot(account_name)
+        if slot is None:
+            return None
+        return self._record(cols, slot, account_name)
+
+    def read_json(self, account_name: str) -> Optional[bytes]:
+        cols, slot = self._slot(account_name)
+        if slot is None:
+            return None
+        payload = cols.json[slot]
+        if payload is not None:
+            return payload
+        # serialize a snapshot of the slot without the lock, then cache it
+        # only if no write changed the slot meanwhile
+        snapshot = (cols.status[slot], cols.created[slot], cols.updated[slot], cols.messages[slot])
+        code, created, updated, message = snapshot
+        payload = CosmosAccountStatusResponse.model_construct(
+            account_name=account_name,
+            status=_STATUS_MEMBERS[code],
+            created_at=datetime.fromtimestamp(created, timezone.utc),
+            updated_at=datetime.fromtimestamp(updated, timezone.utc),
+            message=message
+        ).model_dump_json().encode()
+        with self._lock:
+            current = (cols.status[slot], cols.created[slot], cols.updated[slot], cols.messages[slot])
+            if cols.json[slot] is None and current == snapshot:
+                cols.json[slot] = payload
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cols = _Columns()
+
+
+class _StatusStore(Protocol):
+    """Backing store for StatusTracker records."""
+    # True when calls do network I/O and must be kept off the event loop
+    blocking: bool
+
+    def write(
+            self,
+            account_name: str,
+            status: CosmosAccountStatus,
+            message: Optional[str],
+            now: datetime,
+    ) -> CosmosAccountStatusResponse: ...
+
+    def read(self, account_name: str) -> Optional[CosmosAccountStatusResponse]: ...
+
+    def read_json(self, account_name: str) -> Optional[bytes]: ...
+
+    def clear(self) -> None: ...
+
+
+class _MemoryStatusStore:
+    """
+    Per-process status store split into _SHARDS shards by account name,
+    so writers for different accounts rarely contend on the same lock.
+    Holds at most about `max_entries` accounts, each for `ttl` seconds.
+    """
+    blocking = False
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES, ttl: float = _DEFAULT_TTL_SECONDS) -> None:
+        per_shard = max(1, -(-max_entries // _SHARDS))
+        self._shards = [_StatusShard(per_shard, ttl) for _ in range(_SHARDS)]
+
+    def _shard(self, account_name: str) -> _StatusShard:
+        return self._shards[hash(account_name) % _SHARDS]
+
+    def write(
+            self,
+            account_name: str,
+            status: CosmosAccountStatus,
+            message: Optional[str],
+            now: datetime,
+    ) -> CosmosAccountStatusResponse:
+        return self._shard(account_name).write(account_name, status, message, now)
+
+    def read(self, account_name: str) -> Optional[CosmosAccountStatusResponse]:
+        return self._shard(account_name).read(account_name)
+
+    def read_json(self, account_name: str) -> Optional[bytes]:
+        return self._shard(account_name).read_json(account_name)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+
+class _RedisStatusStore:
+    """
+    Status store shared by all workers through Redis hashes
+    (`cosmos:status:<account>`), each expiring after `ttl` seconds.
+    Uses the synchronous redis client: reads are a single round trip;
+    writes are a WATCH/MULTI transaction (created_at lookup + replace),
+    retried if another worker writes the same account in between.
+    StatusTracker is called from sync code; coroutines go through the
+    StatusTracker *_async methods, which run it in a worker thread.
+    """
+    blocking = True
+
+    def __init__(self, url: str, ttl: int = _DEFAULT_TTL_SECONDS) -> None:
+        self.ttl = ttl
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "STATUS_BACKEND=redis requires the 'redis' package"
+            ) from e
+        self._client: Any = redis.Redis.from_url(url, decode_responses=True)
+        self._watch_error: type[Exception] = redis.WatchError
+
+    def write(
+            self,
+            account_name: str,
+            status: CosmosAccountStatus,
+            message: Optional[str],
+            now: datetime,
+    ) -> CosmosAccountStatusResponse:
+        key = _REDIS_KEY_PREFIX + account_name
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    # keep when the account was first seen (the key expires
+                    # with the TTL); WATCH makes a racing first write retry
+                    # and pick up the other worker's created_at
+                    pipe.watch(key)
+                    created = pipe.hget(key, "created_at")
+                    record = CosmosAccountStatusResponse.model_construct(
+                        account_name=account_name,
+                        status=status,
+                        created_at=now if created is None else datetime.fromtimestamp(float(created), timezone.utc),
+                        updated_at=now,
+                        message=message
+                    )
+                    fields = {
+                        "status": status.value,
+                        "created_at": record.created_at.timestamp(),
+                        "updated_at": now.timestamp(),
+                        # serialized once per write so polling reads are a single HGET
+                        "json": record.model_dump_json(),
+                    }
+                    if message is not None:
+                        fields["message"] = message
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.hset(key, mapping=fields)
+                    pipe.expire(key, self.ttl)
+                    pipe.execute()
+                    return record
+                except self._watch_error:
+                    continue
+
+    def read(self, account_name: str) -> Optional[CosmosAccountStatusResponse]:
+        fields = self._client.hgetall(_REDIS_KEY_PREFIX + account_name)
+        if not fields:
+            return None
+        return CosmosAccountStatusResponse.model_construct(
+            account_name=account_name,
+            status=CosmosAccountStatus(fields["status"]),
+            created_at=datetime.fromtimestamp(float(fields["created_at"]), timezone.utc),
+            updated_at=datetime.fromtimestamp(float(fields["updated_at"]), timezone.utc),
+            message=fields.get("message")
+        )
+
+    def read_json(self, account_name: str) -> Optional[bytes]:
+        payload = self._client.hget(_REDIS_KEY_PREFIX + account_name, "json")
+        return None if payload is None else payload.encode()
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=_REDIS_KEY_PREFIX + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
 class StatusTracker:
     """
     Tracks Provisioning status for a Cosmos Account.
+    Records live in an in-process store by default; call configure()
+    with backend="redis" to share them across uvicorn/gunicorn workers.
+    CosmosAccountStatusResponse objects are only built when a status
+    is written or read. Code running on the event loop uses the
+    *_async methods so a Redis round trip never blocks the loop.
     Attributes:
-        _statues(Dict[str, CosmosAccountStatusResponse]):
-            Dictionary of Cosmos Account Status Responses.
+        _store: Backing status store (in-memory or Redis).
     """
-    _statues: Dict[str, CosmosAccountStatusResponse] = {}
+    _store: _StatusStore = _MemoryStatusStore()
+
+    @classmethod
+    def configure(
+            cls,
+            backend: str = "memory",
+            redis_url: Optional[str] = None,
+            max_entries: int = _DEFAULT_MAX_ENTRIES,
+            ttl: int = _DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Selects the backing store.
+        Args:
+            backend: "memory" (per process) or "redis" (shared by workers)
+            redis_url: Redis connection URL, required for the redis backend
+            max_entries: Approximate cap on statuses kept in memory
+            ttl: Seconds a status is kept after its last update
+        Raises:
+            ValueError: unknown backend, or redis without a URL
+        """
+        if backend == "redis":
+            if not redis_url:
+                raise ValueError("The redis status backend requires a Redis URL")
+            cls._store = _RedisStatusStore(redis_url, ttl)
+        elif backend == "memory":
+            cls._store = _MemoryStatusStore(max_entries, ttl)
+        else:
+            raise ValueError(f"Unknown status backend: {backend}")
 
     @classmethod
     def update_status(
@@ -18,22 +384,18 @@ class StatusTracker:
             account_name: str,
             status: CosmosAccountStatus,
             message: Optional[str] = None
-    )->None:
+    )->CosmosAccountStatusResponse:
         """
         Updates the status of a Cosmos Account provisioning.
         Args:
             account_name: Unique name of the Cosmos Account.
             status: Current status of the CosmosAccountStatus enum
             message: Optional message to display
+        Returns:
+            The CosmosAccountStatusResponse that was stored; created_at is
+            kept from the account's first tracked status.
         """
-        now = datetime.now()
-        cls._statues[account_name] = CosmosAccountStatusResponse(
-            account_name=account_name,
-            status=status,
-            created_at=now,
-            updated_at=now,
-            message=message
-        )
+        return cls._store.write(account_name, status, message, _now())
     @classmethod
     def get_status(
             cls,
@@ -46,4 +408,55 @@ class StatusTracker:
         Returns:
             CosmosAccountStatusResponse if found, None otherwise.
         """
-        return cls._statues.get(account_name, None)
\ No newline at end of file
+        return cls._store.read(account_name)
+    @classmethod
+    def get_status_json(
+            cls,
+            account_name: str,
+    )->Optional[bytes]:
+        """
+        Returns the status of a Cosmos Account provisioning as JSON bytes.
+        The serialized form is cached until the status next changes, so
+        repeated polling does not re-serialize an unchanged status.
+        Args:
+            account_name: Unique name of the Cosmos Account.
+        Returns:
+            JSON-encoded CosmosAccountStatusResponse if found, None otherwise.
+        """
+        return cls._store.read_json(account_name)
+    @classmethod
+    async def update_status_async(
+            cls,
+            account_name: str,
+            status: CosmosAccountStatus,
+            message: Optional[str] = None
+    )->CosmosAccountStatusResponse:
+        """update_status for coroutines; a network-backed store runs in a worker thread."""
+        store = cls._store
+        if store.blocking:
+            return await asyncio.to_thread(store.write, account_name, status, message, _now())
+        return store.write(account_name, status, message, _now())
+    @classmethod
+    async def get_status_async(
+            cls,
+            account_name: str,
+    )->Optional[CosmosAccountStatusResponse]:
+        """get_status for coroutines; a network-backed store runs in a worker thread."""
+        store = cls._store
+        if store.blocking:
+            return await asyncio.to_thread(store.read, account_name)
+        return store.read(account_name)
+    @classmethod
+    async def get_status_json_async(
+            cls,
+            account_name: str,
+    )->Optional[bytes]:
+        """get_status_json for coroutines; a network-backed store runs in a worker thread."""
+        store = cls._store
+        if store.blocking:
+            return await asyncio.to_thread(store.read_json, account_name)
+        return store.read_json(account_name)
+    @classmethod
+    def clear(cls)->None:
+        """Removes all tracked statuses."""
+        cls._store.clear()
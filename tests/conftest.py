@@ -1,31 +1,85 @@
+from typing import Any, Callable
+
 import pytest
-import os
+import pytest_asyncio
+import httpx
+from unittest.mock import AsyncMock
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from dotenv import load_dotenv
 from app.core.config.settings import Settings
+from app.services.status_tracker import StatusTracker
 
-load_dotenv()
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # run every async test on one session-wide event loop
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
-GMAIL_ADDRESS=os.getenv("GMAIL_ADDRESS")
-GMAIL_PASSWORD=os.getenv("GMAIL_PASSWORD")
+@pytest.fixture(autouse=True)
+def _reset_status_tracker() -> None:
+    # every test starts from an empty store, whatever order (or xdist worker) it runs in
+    yield
+    StatusTracker.clear()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings()->Settings:
-    return Settings(
-        GMAIL_ADDRESS=GMAIL_ADDRESS,
-        GMAIL_PASSWORD=GMAIL_PASSWORD,
-    )
+    # Settings reads env vars and .env itself; no load_dotenv needed
+    return Settings()
 
-@pytest.fixture
-def client(mock_settings: Settings)->None:
-    from app.main import app
-    from app.core.config.settings import get_settings
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """The application, imported (and wired up) on first use only."""
+    from app.main import app as _app
+
+    return _app
 
-    #override settings dependency
-    app.dependency_overrides[get_settings] = lambda: mock_settings
+@pytest.fixture(scope="session")
+def client(app: FastAPI)->None:
+    # one app startup/shutdown (lifespan) for the whole test session
     with TestClient(app) as test_client:
         yield test_client
 
     #cleanup
     app.dependency_overrides.clear()
 
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(app: FastAPI) -> httpx.AsyncClient:
+    """Client that calls the app directly on the test event loop (no portal thread)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+@pytest.fixture(scope="session")
+def _cosmos_holder(app: FastAPI) -> list[Any]:
+    # get_cosmos_manager is overridden once; tests only swap what it serves
+    from app.routers.cosmos_router import get_cosmos_manager
+
+    holder: list[Any] = [None]
+
+    async def current_manager() -> Any:
+        if holder[0] is None:
+            return await get_cosmos_manager()
+        return holder[0]
+
+    app.dependency_overrides[get_cosmos_manager] = current_manager
+    yield holder
+    app.dependency_overrides.pop(get_cosmos_manager, None)
+
+@pytest.fixture
+def override_cosmos(_cosmos_holder: list[Any]) -> Callable[[Any], None]:
+    """Setter that serves a manager from get_cosmos_manager; undone after the test."""
+    def install(manager: Any) -> None:
+        _cosmos_holder[0] = manager
+
+    yield install
+    _cosmos_holder[0] = None
+
+@pytest.fixture
+def cosmos_mock(mock_settings: Settings) -> AsyncMock:
+    """AsyncMock AzureCosmosManager; tests only set return values/side effects."""
+    mock_manager = AsyncMock()
+    mock_manager.settings = mock_settings
+    yield mock_manager
+    mock_manager.reset_mock()
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from azure.core.exceptions import HttpResponseError
+from azure.core.polling.async_base_polling import AsyncLROBasePolling
+
+from app.services.azure_cosmos_manager import ArmBatchExecutor, LroMux
+
+
+@pytest.mark.asyncio
+async def test_calls_in_one_window_start_together()->None:
+    """Test concurrent submissions are started in a single batch"""
+    executor = ArmBatchExecutor(max_wait=0.01)
+    started: list[str] = []
+
+    async def start(name: str) -> str:
+        started.append(name)
+        await asyncio.sleep(0)
+        return name
+
+    results = await asyncio.gather(
+        executor.submit(lambda: start("a")),
+        executor.submit(lambda: start("b")),
+        executor.submit(lambda: start("c")),
+    )
+
+    assert results == ["a", "b", "c"]
+    assert started == ["a", "b", "c"]
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_only_to_its_caller()->None:
+    """Test one failing call does not fail the rest of the batch"""
+    executor = ArmBatchExecutor(max_wait=0.01)
+
+    async def fail() -> None:
+        raise RuntimeError("Throttled")
+
+    async def succeed() -> str:
+        return "ok"
+
+    results = await asyncio.gather(
+        executor.submit(fail),
+        executor.submit(succeed),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "ok"
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_lro_mux_polls_all_operations_in_one_round()->None:
+    """Test pending pollers are refreshed together and resolved when done"""
+    mux = LroMux(interval=0.01)
+    pollers = []
+    for name in ("a", "b"):
+        method = MagicMock(spec=AsyncLROBasePolling)
+        method.finished.side_effect = [False, True]
+        poller = MagicMock()
+        poller.polling_method.return_value = method
+        poller.result = AsyncMock(return_value=name)
+        pollers.append(poller)
+
+    results = await asyncio.gather(*(mux.watch(poller) for poller in pollers))
+
+    assert results == ["a", "b"]
+    for poller in pollers:
+        poller.polling_method.return_value.update_status.assert_awaited_once()
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_lro_mux_failed_poll_raises_poller_error()->None:
+    """Test a failed status poll surfaces the poller's AzureError"""
+    mux = LroMux(interval=0.01)
+    method = MagicMock(spec=AsyncLROBasePolling)
+    method.finished.return_value = False
+    method.update_status.side_effect = RuntimeError("bad status")
+    poller = MagicMock()
+    poller.polling_method.return_value = method
+    poller.result = AsyncMock(side_effect=HttpResponseError("boom"))
+
+    with pytest.raises(HttpResponseError):
+        await mux.watch(poller)
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_lro_mux_close_cancels_result_fetches()->None:
+    """Test close() stops result fetches that are still running"""
+    mux = LroMux(interval=0.01)
+    method = MagicMock(spec=AsyncLROBasePolling)
+    method.finished.side_effect = [False, True]
+    started = asyncio.Event()
+
+    async def slow_result()->str:
+        started.set()
+        await asyncio.sleep(60)
+        return "done"
+
+    poller = MagicMock()
+    poller.polling_method.return_value = method
+    poller.result = slow_result
+    future = mux.watch(poller)
+
+    await asyncio.wait_for(started.wait(), timeout=1)
+    await mux.close()
+
+    assert future.cancelled()
+    assert not mux._finishing
@@ -1,39 +1,32 @@
-from typing import Any, Dict
+import asyncio
+from typing import Any, Callable, Dict
 from fastapi.testclient import TestClient
 
-from app.core.config.settings import get_settings
-from app.main import app
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import httpx
+from pytest_mock import MockerFixture
 from app.models.custom_types import CosmosAccountStatus, CosmosAPIType
-from app.routers.cosmos_router import get_cosmos_manager
+from app.routers import cosmos_router
 from app.services.status_tracker import StatusTracker
 
-def test_create_cosmos_account_async() -> None:
+def test_create_cosmos_account_async(
+        client: TestClient, override_cosmos: Callable[[Any], None], cosmos_mock: AsyncMock) -> None:
     """Test account creation endpoint initiates async provisioning"""
     # ARRANGE: set up test conditions and mocks
     #
     # Mock the azure integration class to prevent real API Calls
-    with (
-        patch("app.routers.cosmos_router.AzureCosmosManager")   as mock_manager_class,
-        patch("app.core.config.settings.get_settings") as mock_settings_function
+    mock_poller: MagicMock = MagicMock()
+    mock_poller.result = AsyncMock()
+    mock_async_method: AsyncMock =AsyncMock(return_value=mock_poller)
 
-    ):
+    # Configure mock instance
+    mock_manager_instance = cosmos_mock
+    mock_manager_instance.create_account_async = mock_async_method
 
-        mock_async_method: AsyncMock =AsyncMock()
-
-
-        # Configure mock instance
-        mock_manager_instance = mock_manager_class.return_value
-        mock_manager_instance.create_account_async = mock_async_method
-
-        #override fastapi dep
-        app.dependency_overrides[get_cosmos_manager] = lambda: mock_manager_instance
-        app.dependency_overrides[get_settings] = lambda: mock_settings_function
-
-        # initialize client
-        client: TestClient = TestClient(app)
+    #override fastapi dep
+    override_cosmos(mock_manager_instance)
 
+    with patch.object(cosmos_router, "send_success_notification") as mock_success_email:
         # test payload
 
         test_payload: Dict[str, str] = {
@@ -45,25 +38,27 @@ def test_create_cosmos_account_async() -> None:
         # Act: Make the request
         response: httpx.Response = client.post("/cosmos/accounts", json=test_payload)
 
-        # Assert: Check the response
-        assert response.status_code == 202
+    # Assert: Check the response
+    assert response.status_code == 202
 
-        # Check the response body
-        response_data: Dict[str, Any] = response.json()
-        assert response_data["account_name"] == "test-account"
-        assert response_data["status"] == CosmosAccountStatus.QUEUED
+    # Check the response body
+    response_data: Dict[str, Any] = response.json()
+    assert response_data["account_name"] == "test-account"
+    assert response_data["status"] == CosmosAccountStatus.QUEUED
 
-        # Verify async method was called with correct parameters
-        mock_async_method.assert_awaited_once_with(
-            account_name="test-account",
-            location="Central India",
-            api_type=   CosmosAPIType.SQL
-        )
-
-        # Cleanup: Reset dependency overrides
-        app.dependency_overrides.clear()
+    # Verify async method was called with correct parameters
+    mock_async_method.assert_awaited_once_with(
+        account_name="test-account",
+        location="Central India",
+        api_type=   CosmosAPIType.SQL
+    )
+    mock_poller.result.assert_awaited_once()
+    mock_success_email.assert_called_once()
+    # the email carries the completion time recorded in the status store
+    completed_at = mock_success_email.call_args.args[-1]
+    assert completed_at == StatusTracker.get_status("test-account").updated_at
 
-def test_get_provisioning_status_success() -> None:
+def test_get_provisioning_status_success(client: TestClient) -> None:
     """Test successful status retrieval"""
     # Setup
     test_account = "test-account-123"
@@ -73,7 +68,6 @@ def test_get_provisioning_status_success() -> None:
         "Provisioning in progress"
     )
 
-    client: TestClient = TestClient(app)
     # Execute
     response = client.get(f"/cosmos/accounts/{test_account}")
 
@@ -81,14 +75,89 @@ def test_get_provisioning_status_success() -> None:
     assert response.status_code == 200
     assert response.json()["status"] == "in_progress"
 
-    # Cleanup
-    StatusTracker._statues.clear()
+def test_get_provisioning_status_not_modified(client: TestClient) -> None:
+    """Test polling with the last ETag returns 304 until the status changes"""
+    test_account = "test-account-etag"
+    StatusTracker.update_status(test_account, CosmosAccountStatus.IN_PROGRESS)
 
-def test_get_provisioning_status_not_found() -> None:
+    first = client.get(f"/cosmos/accounts/{test_account}")
+    etag = first.headers["etag"]
+    unchanged = client.get(
+        f"/cosmos/accounts/{test_account}", headers={"If-None-Match": etag}
+    )
+    StatusTracker.update_status(test_account, CosmosAccountStatus.COMPLETED)
+    changed = client.get(
+        f"/cosmos/accounts/{test_account}", headers={"If-None-Match": etag}
+    )
+
+    assert unchanged.status_code == 304
+    assert not unchanged.content
+    assert changed.status_code == 200
+    assert changed.json()["status"] == "completed"
+
+def test_get_provisioning_status_not_found(client: TestClient) -> None:
     """Test status check for non-existent account"""
-    client: TestClient = TestClient(app)
     response = client.get("/cosmos/accounts/non-existent")
 
     assert response.status_code == 404
     assert response.json()["detail"]["error_code"] == "ACCOUNT_NOT_FOUND"
 
+
+def test_create_cosmos_account_invalid_name(client: TestClient) -> None:
+    """Test account name is rejected by the precompiled pattern"""
+    response = client.post(
+        "/cosmos/accounts",
+        json={"account_name": "Invalid_Name-", "location": "Central India"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_create_cosmos_account_already_in_progress(client: TestClient) -> None:
+    """Test a second create for an account still provisioning is rejected"""
+    StatusTracker.update_status("busy-account", CosmosAccountStatus.IN_PROGRESS)
+
+    response = client.post(
+        "/cosmos/accounts",
+        json={"account_name": "busy-account", "location": "Central India"},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["error_code"] == "PROVISIONING_IN_PROGRESS"
+
+
+def test_create_cosmos_account_while_deleting(client: TestClient) -> None:
+    """Test a create for an account being deleted reports the deletion"""
+    StatusTracker.update_status(
+        "deleting-account", CosmosAccountStatus.QUEUED, cosmos_router._DELETION_QUEUED_MESSAGE
+    )
+
+    response = client.post(
+        "/cosmos/accounts",
+        json={"account_name": "deleting-account", "location": "Central India"},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["error_code"] == "DELETION_IN_PROGRESS"
+
+
+async def test_wait_for_poller_writes_only_status_changes(mocker: MockerFixture) -> None:
+    """Test unchanged LRO statuses are not rewritten, so the ETag stays stable"""
+    mocker.patch.object(cosmos_router, "_POLL_STATUS_INTERVAL", 0.001)
+    finished: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    mocker.patch.object(cosmos_router, "watch_lro", return_value=finished)
+    statuses = iter(["InProgress"] * 5 + ["Succeeded"] * 100)
+    poller = MagicMock()
+    poller.status.side_effect = lambda: next(statuses)
+    writes = mocker.patch.object(StatusTracker, "update_status_async", AsyncMock())
+
+    waiting = asyncio.create_task(cosmos_router._wait_for_poller(poller, "polled-account"))
+    while poller.status.call_count < 8:
+        await asyncio.sleep(0.001)
+    finished.set_result(None)
+    await waiting
+
+    assert [c.kwargs["message"] for c in writes.call_args_list] == [
+        "Provisioning status: InProgress",
+        "Provisioning status: Succeeded",
+    ]
@@ -1,45 +1,139 @@
+from typing import Any, Callable, Optional
 
 import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
-from app.main import app
-from app.routers.cosmos_router import get_cosmos_manager
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.core.config.settings import Settings
+from app.routers import cosmos_router
+from app.services import azure_cosmos_manager
+from app.services.azure_cosmos_manager import AccountNotFound, AzureCosmosManager
+from app.services.status_tracker import StatusTracker
+from app.models.custom_types import CosmosAccountStatus
+from azure.core.exceptions import AzureError, ResourceNotFoundError
 
+# parsed once; the parametrized delete test sends it on every run
+_DELETE_URL = httpx.URL("http://testserver/cosmos/accounts/test_account")
 
-def test_successful_delete_account_with_email()-> None:
-    #Setup
-    with (
-        patch("app.routers.cosmos_router.AzureCosmosManager")   as mock_manager,
-    ):
 
-        mock_instance = mock_manager.return_value
-        mock_instance.account_exists = AsyncMock(return_value=True)
-        mock_instance.delete_account_async=AsyncMock()
-        app.dependency_overrides[get_cosmos_manager]= lambda : mock_instance
+@pytest.fixture(scope="module")
+def _module_cosmos(mock_settings: Settings) -> AsyncMock:
+    mock_manager = AsyncMock()
+    mock_manager.settings = mock_settings
+    return mock_manager
+
+@pytest.fixture
+def delete_cosmos(_module_cosmos: AsyncMock) -> AsyncMock:
+    """One AsyncMock manager for the whole module, reset after each test."""
+    yield _module_cosmos
+    _module_cosmos.reset_mock(return_value=True, side_effect=True)
 
-    #Act
 
-        client = TestClient(app)
-        response: httpx.Response = client.delete("/cosmos/accounts/test_account")
-        assert response.status_code == 204
+@pytest.mark.parametrize(
+    "delete_error, status_expected",
+    [(None, 204), (AccountNotFound("Account does not exist"), 404)],
+    ids=["existing", "missing"],
+)
+def test_delete_account_with_email(
+        client: TestClient,
+        override_cosmos: Callable[[Any], None],
+        delete_cosmos: AsyncMock,
+        delete_error: Optional[Exception],
+        status_expected: int,
+)-> None:
+    #Setup
+    mock_instance = delete_cosmos
+    mock_instance.delete_account_async.side_effect = delete_error
+    override_cosmos(mock_instance)
+
+    #Act
+    response: httpx.Response = client.request("DELETE", _DELETE_URL)
+    assert response.status_code == status_expected
+    if delete_error is None:
         assert not response.content
-        mock_instance.delete_account_async.assert_awaited_once_with("test_account")
-        app.dependency_overrides.clear()
+    mock_instance.delete_account_async.assert_awaited_once_with("test_account")
 
-def test_unsuccessful_delete_account_with_email()-> None:
+def test_delete_account_azure_error(
+        client: TestClient, override_cosmos: Callable[[Any], None], delete_cosmos: AsyncMock)-> None:
     #Setup
+    mock_instance = delete_cosmos
+    mock_instance.delete_account_async.side_effect=AzureError("Throttled")
+    override_cosmos(mock_instance)
+
+    with patch.object(cosmos_router, "send_deletion_failure_email") as mock_email:
+        #Act
+        response: httpx.Response = client.delete("/cosmos/accounts/azure-failing-account")
+    assert response.status_code == 500
+    assert response.json()["detail"]["error_code"] == "AZURE_ERROR"
+    mock_email.assert_called_once()
+    stored = StatusTracker.get_status("azure-failing-account")
+    assert stored is not None
+    assert stored.status == CosmosAccountStatus.ERROR
+    assert stored.message == "Throttled"
+
+@pytest.mark.parametrize(
+    "delete_error",
+    [AzureError("Throttled"), RuntimeError("Unexpected")],
+    ids=["azure", "unexpected"],
+)
+def test_create_allowed_after_failed_delete(
+        app: FastAPI,
+        override_cosmos: Callable[[Any], None],
+        delete_cosmos: AsyncMock,
+        delete_error: Exception,
+)-> None:
+    """Test a failed deletion does not block provisioning the account again"""
+    delete_cosmos.delete_account_async.side_effect = delete_error
+    override_cosmos(delete_cosmos)
+
+    # unexpected errors surface as a 500 instead of being re-raised here
+    client = TestClient(app, raise_server_exceptions=False)
     with (
-        patch("app.routers.cosmos_router.AzureCosmosManager")   as mock_manager,
+        patch.object(cosmos_router, "send_deletion_failure_email"),
+        patch.object(cosmos_router, "execute_provisioning"),
     ):
-        mock_instance = mock_manager.return_value
-        mock_instance.account_exists = AsyncMock(return_value=False)
-        mock_instance.delete_account_async.side_effect=ValueError("Account does not exist")
-        app.dependency_overrides[get_cosmos_manager]= lambda : mock_instance
+        deleted = client.delete("/cosmos/accounts/retry-account")
+        created = client.post(
+            "/cosmos/accounts",
+            json={"account_name": "retry-account", "location": "Central India"},
+        )
 
-        #Act
+    assert deleted.status_code == 500
+    assert created.status_code == 202
+
+@pytest_asyncio.fixture
+async def arm_manager(mock_settings: Settings) -> AzureCosmosManager:
+    """AzureCosmosManager whose ARM client is a MagicMock."""
+    # no real SDK client or shared aiohttp session is created or cached
+    with patch.object(azure_cosmos_manager, "_get_shared_client", return_value=MagicMock()):
+        manager = AzureCosmosManager(
+            "00000000-0000-0000-0000-000000000000",
+            "test-rg",
+            credential=AsyncMock(),
+            settings=mock_settings,
+        )
+    yield manager
+    await manager.close()
+
+@pytest.mark.asyncio
+async def test_delete_missing_account_maps_not_found(arm_manager: AzureCosmosManager)-> None:
+    """Test ARM's 404 from begin_delete surfaces as AccountNotFound without a GET"""
+    arm_manager.client.database_accounts.begin_delete = AsyncMock(
+        side_effect=ResourceNotFoundError("Not found")
+    )
+
+    with pytest.raises(AccountNotFound):
+        await arm_manager.delete_account_async("missing-account")
+    arm_manager.client.database_accounts.get.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_delete_azure_error_is_not_wrapped(arm_manager: AzureCosmosManager)-> None:
+    """Test other ARM errors from begin_delete reach the router as AzureError"""
+    arm_manager.client.database_accounts.begin_delete = AsyncMock(
+        side_effect=AzureError("Throttled")
+    )
 
-        client = TestClient(app)
-        response: httpx.Response = client.delete("/cosmos/accounts/failing-account")
-        assert response.status_code == 404
-        mock_instance.delete_account_async.assert_called_once_with("failing-account")
-        app.dependency_overrides.clear()
\ No newline at end of file
+    with pytest.raises(AzureError):
+        await arm_manager.delete_account_async("busy-account")
@@ -1,35 +1,68 @@
+import json
+from typing import Any, Awaitable, Callable
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import status
-from httpx import Response
+from httpx import AsyncClient, Response
 
 from pytest_mock import MockerFixture
 from app.models.cosmos_models import CosmosAPIType
+from app.core.config.settings import Settings
+from app.routers import cosmos_router
+from app.services import email_service
+from app.services.gmail_sender import GmailSender, GmailSenderPool
 
+# provisioning request body, encoded once for every POST in this module
+_PROVISION_BODY = json.dumps({
+    "account_name": "test-account",
+    "location": "Central India",
+    "api_type": CosmosAPIType.SQL.value,
+}).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
+class _FailingManager:
+    """Stand-in AzureCosmosManager whose provisioning always fails."""
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+    async def create_account_async(self, **kwargs: Any) -> None:
+        raise Exception("Disk Full")
+
+
+
+@pytest.fixture
+def post_provisioning(async_client: AsyncClient) -> Callable[[], Awaitable[Response]]:
+    """Sends this module's provisioning request through the shared async client."""
+    def post() -> Awaitable[Response]:
+        return async_client.post("/cosmos/accounts", content=_PROVISION_BODY, headers=_JSON_HEADERS)
+
+    return post
+
 @pytest.mark.asyncio
-async def test_provisioning_failure_sends_email(mocker: MockerFixture, client: TestClient)->None:
+async def test_provisioning_failure_sends_email(
+        mocker: MockerFixture,
+        post_provisioning: Callable[[], Awaitable[Response]],
+        override_cosmos: Callable[[Any], None],
+        mock_settings: Settings,
+)->None:
     """
     Test that a provisioning failure triggers an email notification
     with proper error details
     """
-    #Mock external dependencies
-    mock_email: MagicMock= mocker.patch("app.services.gmail_sender.GmailSender.send")
-    mock_manager: AsyncMock = AsyncMock()
-    mock_manager.create_account_async.side_effect = Exception("Disk Full")
+    #Mock external dependencies: no SMTP connection, and the email is
+    #delivered inline on the notifier's thread rather than queued to a
+    #mail worker another test may have started
+    mocker.patch.object(email_service, "_mail_loop", None)
+    mocker.patch.object(GmailSender, "connect")
+    mocker.patch.object(
+        email_service, "get_gmail_pool", return_value=GmailSenderPool(mock_settings, size=1)
+    )
+    mock_email: MagicMock= mocker.patch.object(GmailSender, "send", return_value={"success": True})
+    override_cosmos(_FailingManager(mock_settings))
 
     #Simulate failed provisioning request
-    with patch("app.routers.cosmos_router.AzureCosmosManager", return_value=mock_manager):
-        response: Response = client.post(
-            "/cosmos/accounts",
-            json={
-                "account_name": "test-account",
-                "location" : "Central India",
-                "api_type": CosmosAPIType.SQL
-            }
-        )
+    response: Response = await post_provisioning()
 
     status_code: int = response.status_code
     response_data: dict[str,str] = response.json()
@@ -40,10 +73,94 @@ async def test_provisioning_failure_sends_email(mocker: MockerFixture, client: T
     #Verify email parameters with type checks
     call_kwargs = mock_email.call_args.kwargs
 
-    assert call_kwargs["to"]== "rijo.john@infracloud.io" #incorrect recipient
+    assert call_kwargs["to"] == mock_settings.GMAIL_ADDRESS
     assert "Provisioning failed" in call_kwargs["subject"]
     assert "Disk Full" in call_kwargs["body"]
 
-#TODO: need to write test for successful provisioning email sending
 
+@pytest.mark.asyncio
+async def test_provisioning_outcome_notifications(
+        mocker: MockerFixture,
+        post_provisioning: Callable[[], Awaitable[Response]],
+        override_cosmos: Callable[[Any], None],
+        cosmos_mock: AsyncMock,
+)->None:
+    """
+    Test that failed and successful provisioning each trigger their
+    notification; both requests go through the same client connection
+    """
+    mock_failure: MagicMock = mocker.patch.object(cosmos_router, "send_failure_notification")
+    mock_success: MagicMock = mocker.patch.object(cosmos_router, "send_success_notification")
+    mock_poller: MagicMock = MagicMock()
+    mock_poller.result = AsyncMock()
+    override_cosmos(cosmos_mock)
+
+    for side_effect, sent, not_sent in (
+        (Exception("Disk Full"), mock_failure, mock_success),
+        (None, mock_success, mock_failure),
+    ):
+        cosmos_mock.create_account_async.side_effect = side_effect
+        cosmos_mock.create_account_async.return_value = mock_poller
+
+        response: Response = await post_provisioning()
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        sent.assert_called_once()
+        assert sent.call_args.args[0] == "test-account"
+        not_sent.assert_not_called()
+        mock_failure.reset_mock()
+        mock_success.reset_mock()
+
+
+
+@pytest.mark.asyncio
+async def test_queued_emails_are_sent_in_one_batch(mocker: MockerFixture, mock_settings: Settings)->None:
+    """
+    Test that emails queued while the mail worker runs are delivered
+    together on one SMTP session before the worker stops
+    """
+    mock_batch: MagicMock = mocker.patch.object(email_service, "_deliver_batch")
+    mocker.patch.object(email_service, "_HAS_AIOSMTPLIB", False)
+
+    await email_service.start_mail_worker()
+    email_service.send_email("subject 1", "body 1", mock_settings)
+    email_service.send_email("subject 2", "body 2", mock_settings)
+    await email_service.stop_mail_worker()
+
+    mock_batch.assert_called_once_with([
+        ("subject 1", "body 1", mock_settings),
+        ("subject 2", "body 2", mock_settings),
+    ])
+
+
+def test_smtp_pool_reuses_connected_session(mocker: MockerFixture, mock_settings: Settings)->None:
+    """
+    Test that consecutive emails borrow the same pooled SMTP session
+    instead of connecting (TLS + login) for each one
+    """
+    mock_connect: MagicMock = mocker.patch.object(GmailSender, "connect")
+    pool = GmailSenderPool(mock_settings, size=2)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    mock_connect.assert_called_once()
+
+
+def test_failed_send_drops_pooled_session(mocker: MockerFixture, mock_settings: Settings)->None:
+    """
+    Test that a session whose send reports failure is not returned to
+    the pool, so the next email connects afresh
+    """
+    mock_connect: MagicMock = mocker.patch.object(GmailSender, "connect")
+    mocker.patch.object(GmailSender, "send", return_value={"success": False, "error": "530"})
+    pool = GmailSenderPool(mock_settings, size=1)
+    mocker.patch.object(email_service, "get_gmail_pool", return_value=pool)
+
+    email_service._deliver("subject 1", "body 1", mock_settings)
+    email_service._deliver("subject 2", "body 2", mock_settings)
 
+    assert mock_connect.call_count == 2
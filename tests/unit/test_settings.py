@@ -1,7 +1,31 @@
+import pytest
+from pydantic import ValidationError
 from app.core.config.settings import get_settings, Settings
 
-def test_get_settings():
-    settings = get_settings()
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    return get_settings()
+
+
+def test_get_settings(settings: Settings):
     assert isinstance(settings, Settings)
     assert settings.AZURE_SUBSCRIPTION_ID is not None
+    # built once per process
+    assert get_settings() is settings
+
+
+def test_partial_gmail_oauth_settings_rejected():
+    with pytest.raises(ValidationError, match="must be set together"):
+        Settings(GMAIL_OAUTH_CLIENT_ID="client-id")
+
+
+def test_redis_status_backend_requires_url():
+    with pytest.raises(ValidationError, match="requires REDIS_URL"):
+        Settings(STATUS_BACKEND="redis", REDIS_URL=None)
+
 
+def test_redis_url_alone_selects_redis_backend(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.delenv("STATUS_BACKEND", raising=False)
+    assert Settings().STATUS_BACKEND == "redis"
+    assert Settings(STATUS_BACKEND="memory").STATUS_BACKEND == "memory"
@@ -0,0 +1,241 @@
+import sys
+import time
+import types
+from datetime import datetime, timezone
+from typing import Any, Optional
+from unittest.mock import patch
+
+import pytest
+from app.models.custom_types import CosmosAccountStatus
+from app.services.status_tracker import StatusTracker, _RedisStatusStore
+
+
+def test_oldest_statuses_are_evicted_when_full() -> None:
+    """Test the in-memory store stays bounded and keeps the newest statuses"""
+    StatusTracker.configure(max_entries=16)
+    try:
+        for i in range(200):
+            StatusTracker.update_status(f"account-{i}", CosmosAccountStatus.QUEUED)
+
+        kept = [i for i in range(200) if StatusTracker.get_status(f"account-{i}")]
+        assert len(kept) <= 16
+        assert 199 in kept
+    finally:
+        StatusTracker.configure()
+
+
+def test_expired_statuses_are_not_returned() -> None:
+    """Test statuses older than the TTL read as missing"""
+    StatusTracker.configure(ttl=0)
+    try:
+        StatusTracker.update_status("old-account", CosmosAccountStatus.COMPLETED)
+
+        assert StatusTracker.get_status("old-account") is None
+        assert StatusTracker.get_status_json("old-account") is None
+    finally:
+        StatusTracker.configure()
+
+
+def test_update_keeps_created_at() -> None:
+    """Test a status transition keeps the first created_at and moves updated_at"""
+    queued = StatusTracker.update_status("keep-created", CosmosAccountStatus.QUEUED)
+    time.sleep(0.002)
+    done = StatusTracker.update_status("keep-created", CosmosAccountStatus.COMPLETED)
+
+    stored = StatusTracker.get_status("keep-created")
+    assert stored is not None
+    assert done.created_at == queued.created_at == stored.created_at
+    assert done.updated_at > queued.updated_at
+
+
+def test_stale_json_is_not_cached_over_a_newer_write() -> None:
+    """Test a read racing a write does not cache the JSON of the older status"""
+    from app.services import status_tracker
+
+    StatusTracker.update_status("racy-account", CosmosAccountStatus.IN_PROGRESS)
+    shard = StatusTracker._store._shard("racy-account")
+    dump_json = status_tracker.CosmosAccountStatusResponse.model_dump_json
+
+    def dump_then_write(record, *args, **kwargs):
+        payload = dump_json(record, *args, **kwargs)
+        # a writer lands between the reader serializing and caching
+        StatusTracker.update_status("racy-account", CosmosAccountStatus.COMPLETED)
+        return payload
+
+    with patch.object(status_tracker.CosmosAccountStatusResponse, "model_dump_json", dump_then_write):
+        shard.read_json("racy-account")
+
+    assert b'"completed"' in StatusTracker.get_status_json("racy-account")
+
+
+async def test_blocking_store_runs_off_the_event_loop() -> None:
+    """Test the async methods call a network-backed store from a worker thread"""
+    import threading
+
+    loop_thread = threading.get_ident()
+    calls: list[int] = []
+
+    class _BlockingStore:
+        blocking = True
+
+        def read_json(self, account_name: str) -> bytes:
+            calls.append(threading.get_ident())
+            return b"{}"
+
+    store = StatusTracker._store
+    StatusTracker._store = _BlockingStore()
+    try:
+        assert await StatusTracker.get_status_json_async("any-account") == b"{}"
+    finally:
+        StatusTracker._store = store
+
+    assert calls and calls[0] != loop_thread
+
+
+class _WatchError(Exception):
+    pass
+
+
+class _FakeRedis:
+    """In-memory stand-in for the parts of redis.Redis the status store uses."""
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.versions: dict[str, int] = {}
+        # called once with the client after the next WATCHed read
+        self.on_watched_read: Any = None
+
+    def _touch(self, key: str) -> None:
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key: str, mapping: dict[str, Any]) -> None:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+        self._touch(key)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.ttls.pop(key, None)
+            self._touch(key)
+
+    def expire(self, key: str, ttl: int) -> None:
+        self.ttls[key] = ttl
+
+    def scan_iter(self, match: str) -> list[str]:
+        return [key for key in self.hashes if key.startswith(match.rstrip("*"))]
+
+    def pipeline(self) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self.client = client
+        self.watched: dict[str, int] = {}
+        self.queued: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __enter__(self) -> "_FakePipeline":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.watched.clear()
+
+    def watch(self, key: str) -> None:
+        self.watched[key] = self.client.versions.get(key, 0)
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        value = self.client.hget(key, field)
+        hook, self.client.on_watched_read = self.client.on_watched_read, None
+        if hook is not None:
+            hook(self.client)
+        return value
+
+    def multi(self) -> None:
+        self.queued = []
+
+    def __getattr__(self, name: str) -> Any:
+        # delete/hset/expire after multi() are queued until execute()
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    def execute(self) -> None:
+        changed = any(self.client.versions.get(k, 0) != v for k, v in self.watched.items())
+        self.watched.clear()
+        if changed:
+            raise _WatchError()
+        for name, args, kwargs in self.queued:
+            getattr(self.client, name)(*args, **kwargs)
+
+
+@pytest.fixture
+def redis_store(monkeypatch: pytest.MonkeyPatch) -> tuple[_RedisStatusStore, _FakeRedis]:
+    fake = _FakeRedis()
+    redis_module = types.SimpleNamespace(
+        Redis=types.SimpleNamespace(from_url=lambda url, decode_responses: fake),
+        WatchError=_WatchError,
+    )
+    monkeypatch.setitem(sys.modules, "redis", redis_module)
+    return _RedisStatusStore("redis://fake", ttl=60), fake
+
+
+def test_redis_store_round_trip(redis_store: tuple[_RedisStatusStore, _FakeRedis]) -> None:
+    """Test a Redis write is readable as a record and as cached JSON, with the TTL set"""
+    store, fake = redis_store
+    now = datetime.now(timezone.utc)
+    written = store.write("redis-account", CosmosAccountStatus.IN_PROGRESS, "started", now)
+
+    read = store.read("redis-account")
+    assert read is not None
+    assert read.status == CosmosAccountStatus.IN_PROGRESS
+    assert read.message == "started"
+    assert read.updated_at == written.updated_at
+    assert store.read_json("redis-account") == written.model_dump_json().encode()
+    assert fake.ttls["cosmos:status:redis-account"] == 60
+    assert store.read("missing") is None
+    assert store.read_json("missing") is None
+
+
+def test_redis_store_keeps_created_at(redis_store: tuple[_RedisStatusStore, _FakeRedis]) -> None:
+    """Test later Redis writes keep the first created_at and drop stale messages"""
+    store, _ = redis_store
+    first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    later = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    store.write("redis-account", CosmosAccountStatus.QUEUED, "queued", first)
+    store.write("redis-account", CosmosAccountStatus.COMPLETED, None, later)
+
+    read = store.read("redis-account")
+    assert read is not None
+    assert read.created_at == first
+    assert read.updated_at == later
+    assert read.message is None
+
+
+def test_redis_store_racing_first_write_keeps_created_at(
+        redis_store: tuple[_RedisStatusStore, _FakeRedis]) -> None:
+    """Test a write racing another worker's first write retries and keeps its created_at"""
+    store, fake = redis_store
+    other = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mine = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    fake.on_watched_read = lambda client: client.hset(
+        "cosmos:status:redis-account",
+        mapping={"status": "queued", "created_at": other.timestamp(), "updated_at": other.timestamp()},
+    )
+
+    written = store.write("redis-account", CosmosAccountStatus.IN_PROGRESS, None, mine)
+
+    assert written.created_at == other
+    read = store.read("redis-account")
+    assert read is not None and read.created_at == other
+
+
+def test_redis_store_clear(redis_store: tuple[_RedisStatusStore, _FakeRedis]) -> None:
+    store, fake = redis_store
+    store.write("redis-account", CosmosAccountStatus.QUEUED, None, datetime.now(timezone.utc))
+    store.clear()
+    assert store.read("redis-account") is None
+    assert not fake.hashes